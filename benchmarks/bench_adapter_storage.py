@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Compares Adapter storage memory use against the former defaultdict tree
+
+Both stores are filled with the same nested keys, then probed for
+missing optional keys, as applications do under load.
+
+It reports memory rather than time, hence lives outside the run.py suite.
+
+Usage: python benchmarks/bench_adapter_storage.py [keys] [probes]
+"""
+import os
+import sys
+import tracemalloc
+from collections import defaultdict
+from functools import reduce
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etcaetera.adapter import Adapter
+
+
+Tree = lambda: defaultdict(Tree)
+
+
+class TreeAdapter(Adapter):
+    """Adapter storing its data the way it used to, for comparison"""
+    def __init__(self, *args, **kwargs):
+        super(TreeAdapter, self).__init__(*args, **kwargs)
+        self.data = Tree()
+
+    def __getitem__(self, key):
+        return reduce(lambda d, k: d[k], key.split('.'), self.data)
+
+    def __setitem__(self, key, value):
+        subkeys = key.split('.')
+        reduce(lambda d, k: d[k], subkeys[:-1], self.data)[subkeys[-1]] = value
+
+
+def fill(adapter, keys):
+    for index in range(keys):
+        adapter['SECTION_{0}.GROUP_{1}.KEY_{2}'.format(index % 100, index % 10, index)] = index
+
+
+def probe(adapter, probes):
+    for index in range(probes):
+        try:
+            adapter['OPTIONAL_{0}.GROUP.KEY'.format(index)]
+        except KeyError:
+            pass
+
+
+def measure(adapter_class, keys, probes):
+    """Returns the memory held by an adapter once filled, then once probed"""
+    tracemalloc.start()
+    adapter = adapter_class()
+
+    fill(adapter, keys)
+    filled = tracemalloc.get_traced_memory()[0]
+    probe(adapter, probes)
+    probed = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.stop()
+    return filled, probed
+
+
+def main(keys, probes):
+    print("{0} keys, {1} missing keys probes".format(keys, probes))
+    for name, adapter_class in (('defaultdict', TreeAdapter), ('dict', Adapter)):
+        filled, probed = measure(adapter_class, keys, probes)
+        print("  {0:<12} filled {1:8.1f} KB  probed {2:8.1f} KB".format(
+            name, filled / 1024.0, probed / 1024.0))
+
+
+if __name__ == '__main__':
+    keys = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    probes = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    main(keys, probes)
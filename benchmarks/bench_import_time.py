@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""Measures etcaetera import time, and fails when it exceeds a budget
+
+Each module is imported in a fresh interpreter, and the interpreter
+own startup time is subtracted from the measurement.
+
+It exits with a non-zero status over budget, for CI, and spawns its own
+interpreters, hence lives outside the run.py suite.
+
+Usage: python benchmarks/bench_import_time.py [budget_in_ms] [module ...]
+"""
+import os
+import sys
+import time
+import subprocess
+
+
+DEFAULT_BUDGET = 40.0  # ms
+DEFAULT_MODULES = ['etcaetera', 'etcaetera.config', 'etcaetera.adapter']
+
+# Interpreters run from the repository root, for etcaetera to be importable
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def timing(statement, repeat=10):
+    """Returns the best wall time, in ms, of running statement in a fresh interpreter"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, '-c', statement], cwd=ROOT)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings) * 1000
+
+
+def main(budget, modules):
+    baseline = timing('pass')
+    print("interpreter startup {0:8.1f} ms".format(baseline))
+
+    over_budget = False
+    for module in modules:
+        elapsed = timing('import {0}'.format(module)) - baseline
+        status = 'ok' if elapsed <= budget else 'OVER BUDGET'
+        over_budget = over_budget or elapsed > budget
+        print("{0:<20} {1:8.1f} ms  {2}".format(module, elapsed, status))
+
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET
+    sys.exit(main(budget, sys.argv[2:] or DEFAULT_MODULES))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Measures the memory many per-tenant configs use, with and without interning
+
+Every tenant config loads the same defaults, parsed separately as they
+would be from each tenant own file, plus a few tenant specific overrides.
+
+It reports memory first, hence lives outside the run.py suite.
+
+Usage: python benchmarks/bench_tenants.py [tenants]
+"""
+import os
+import gc
+import sys
+import json
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etcaetera.config import Config
+from etcaetera.adapter import Defaults, Overrides
+from etcaetera.interning import InternPool
+
+
+DEFAULTS = json.dumps(dict(
+    [("setting_{0}".format(index), "value {0}".format(index)) for index in range(50)] +
+    [("limit_{0}".format(index), 100000 + index) for index in range(20)] +
+    [("database", {"host": "db.internal.example.com", "port": 5432, "pool": {"size": 10}})]
+))
+
+
+def build(tenants, intern):
+    configs = []
+    for tenant in range(tenants):
+        config = Config(
+            Defaults(json.loads(DEFAULTS)),
+            Overrides({"tenant": "tenant-{0}".format(tenant), "setting_0": "custom"}),
+            intern=intern,
+        )
+        config.load()
+        configs.append(config)
+    return configs
+
+
+def measure(tenants, intern):
+    """Returns the memory held by the tenants configs, and the time it took to load them"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    configs = build(tenants, intern)
+
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del configs
+    return memory, elapsed
+
+
+def main(tenants):
+    print("{0} tenants".format(tenants))
+
+    plain_memory, plain_time = measure(tenants, False)
+    print("  no interning  {0:8.1f} MB  {1:6.2f} s".format(plain_memory / 2.0 ** 20, plain_time))
+
+    pool = InternPool()
+    interned_memory, interned_time = measure(tenants, pool)
+    print("  interning     {0:8.1f} MB  {1:6.2f} s  -{2:.0%}".format(
+        interned_memory / 2.0 ** 20, interned_time, 1 - interned_memory / float(plain_memory)))
+
+    info = pool.info()
+    print("  pool: {0} values, {1} hits, {2:.1f} MB of duplicates dropped".format(
+        info.currsize, info.hits, info.saved_bytes / 2.0 ** 20))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
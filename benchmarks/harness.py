@@ -0,0 +1,172 @@
+"""Minimal benchmark harness: registry, timing, results storage and comparison
+
+Benchmarks are generator functions taking a parameter: they set up
+what they need, yield the callable to time, then clean up.
+"""
+import gc
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+from contextlib import contextmanager
+from collections import namedtuple
+
+import etcaetera
+
+
+Benchmark = namedtuple('Benchmark', ['name', 'function', 'params', 'full_params'])
+
+# Registered benchmarks, in registration order
+BENCHMARKS = []
+
+
+def benchmark(name, params=(None,), full_params=()):
+    """Registers a benchmark
+
+    :param  name: benchmark name, parameters are appended to it
+    :type   name: str
+
+    :param  params: parameters the benchmark runs with
+    :type   params: list
+
+    :param  full_params: additional parameters, only run in full mode,
+                         for the slowest runs
+    :type   full_params: list
+    """
+    def register(function):
+        BENCHMARKS.append(Benchmark(name, contextmanager(function), tuple(params), tuple(full_params)))
+        return function
+    return register
+
+
+def run_name(name, param):
+    return name if param is None else '{0}[{1}]'.format(name, param)
+
+
+def time_callable(run, min_time, repeat):
+    """Returns the best and median time per call of run, and the loops count"""
+    # Warm up imports and caches the first call could pay for
+    run()
+
+    loops, elapsed = 1, 0.0
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 10 ** 6:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    timings = [elapsed / loops]
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(loops):
+                run()
+            timings.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    timings.sort()
+    return timings[0], timings[len(timings) // 2], loops
+
+
+def run(pattern=None, full=False, min_time=0.1, repeat=5, output=sys.stdout):
+    """Runs the registered benchmarks whose name contains pattern
+
+    :returns: results, by benchmark run name
+    :rtype: dict
+    """
+    results = {}
+    for bench in BENCHMARKS:
+        params = bench.params + (bench.full_params if full else ())
+        for param in params:
+            name = run_name(bench.name, param)
+            if pattern is not None and pattern not in name:
+                continue
+
+            with bench.function(param) as callable_:
+                best, median, loops = time_callable(callable_, min_time, repeat)
+
+            results[name] = {'min': best, 'median': median, 'loops': loops}
+            output.write('{0:<48} {1:>12}  (median {2}, {3} loops)\n'.format(
+                name, format_time(best), format_time(median), loops))
+            output.flush()
+
+    return results
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return '{0:.2f} {1}'.format(seconds / scale, unit)
+    return '{0:.1f} ns'.format(seconds / 1e-9)
+
+
+def git_revision():
+    try:
+        output = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                         stderr=subprocess.DEVNULL,
+                                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def save(results, directory):
+    """Stores results along with the environment they were measured in
+
+    :returns: the results file path
+    """
+    revision = git_revision()
+    document = {
+        'etcaetera': etcaetera.__version__,
+        'revision': revision,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    path = os.path.join(directory, '{0}-{1}-py{2}.json'.format(
+        etcaetera.__version__, revision or time.strftime('%Y%m%d%H%M%S'),
+        platform.python_version()))
+    with open(path, 'w') as fd:
+        json.dump(document, fd, indent=2, sort_keys=True)
+
+    return path
+
+
+def compare(results, baseline_path, threshold, output=sys.stdout):
+    """Compares results against stored ones
+
+    :returns: names of the benchmarks slower than threshold times the baseline
+    :rtype: list
+    """
+    with open(baseline_path) as fd:
+        baseline = json.load(fd)
+
+    output.write('\nCompared to {0} ({1}, python {2})\n'.format(
+        baseline_path, baseline.get('revision') or baseline.get('etcaetera'), baseline.get('python')))
+
+    regressions = []
+    for name in sorted(set(results) & set(baseline['results'])):
+        ratio = results[name]['min'] / baseline['results'][name]['min']
+        status = ''
+        if ratio > 1 + threshold:
+            status = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+        output.write('{0:<48} x{1:6.2f}  {2}\n'.format(name, ratio, status))
+
+    return regressions
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Runs the benchmark suite, optionally storing and comparing its results
+
+Usage:
+    python benchmarks/run.py [--filter NAME] [--full] [--quick]
+                             [--save] [--compare RESULTS_FILE] [--threshold 0.2]
+
+Results saved under benchmarks/results are named after the etcaetera
+version and git revision they were measured at: comparing a run against
+the results of a previous version shows its regressions, and exits with
+a non-zero status when there are any.
+
+The harness times calls only: the standalone bench_*.py scripts next to
+this one measure what it can't, memory use (bench_adapter_storage.py,
+bench_tenants.py) and fresh interpreters import time checked against a
+budget (bench_import_time.py), and are run on their own.
+"""
+import os
+import sys
+import argparse
+
+# The repository root, for etcaetera, and this directory, for the harness
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import harness
+import suite.adapters
+import suite.config
+import suite.env
+import suite.files
+import suite.formatters
+import suite.json_backends
+
+
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="etcaetera benchmark suite")
+    parser.add_argument('--filter', help="only run benchmarks whose name contains FILTER")
+    parser.add_argument('--full', action='store_true', help="also run the largest inputs, up to 100MB files")
+    parser.add_argument('--quick', action='store_true', help="run each benchmark for less time, noisier")
+    parser.add_argument('--save', action='store_true', help="store results under benchmarks/results")
+    parser.add_argument('--compare', metavar='RESULTS_FILE', help="compare results against stored ones")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="slowdown ratio reported as a regression, defaults to 0.2")
+    args = parser.parse_args(argv)
+
+    min_time, repeat = (0.02, 3) if args.quick else (0.1, 5)
+    results = harness.run(args.filter, full=args.full, min_time=min_time, repeat=repeat)
+
+    if args.save:
+        print("\nResults saved to {0}".format(harness.save(results, RESULTS_DIRECTORY)))
+
+    if args.compare:
+        regressions = harness.compare(results, args.compare, args.threshold)
+        if regressions:
+            print("\n{0} regression(s) above {1:.0%}".format(len(regressions), args.threshold))
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Benchmarks of the suite run by benchmarks/run.py, see benchmarks/harness.py"""
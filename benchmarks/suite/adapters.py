@@ -0,0 +1,28 @@
+from etcaetera.adapter import Adapter, AdapterSet, Defaults, Overrides
+
+from harness import benchmark
+
+
+@benchmark('adapter.getitem', params=['depth-1', 'depth-3', 'depth-5'])
+def adapter_getitem(param):
+    """Looks up a nested key"""
+    depth = int(param.split('-')[1])
+    key = '.'.join('LEVEL_{0}'.format(level) for level in range(depth))
+
+    adapter = Adapter()
+    adapter[key] = 'value'
+
+    yield lambda: adapter[key]
+
+
+@benchmark('adapterset.insert', params=[10, 100, 1000])
+def adapterset_insert(size):
+    """Inserts an adapter in the middle of an AdapterSet, then removes it"""
+    adapters = AdapterSet(Defaults({}), *([Adapter() for _ in range(size)] + [Overrides({})]))
+    adapter, index = Adapter(), size // 2
+
+    def insert():
+        adapters.insert(index, adapter)
+        del adapters[index]
+
+    yield insert
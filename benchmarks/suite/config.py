@@ -0,0 +1,61 @@
+from etcaetera.config import Config
+from etcaetera.adapter import Adapter, Defaults
+
+from harness import benchmark
+
+
+KEYS = 100
+
+
+class DictAdapter(Adapter):
+    """In memory adapter, loading its source again unless given a fingerprint"""
+    def __init__(self, source, version=None, *args, **kwargs):
+        super(DictAdapter, self).__init__(*args, **kwargs)
+        self.source = source
+        self.version = version
+
+    def fingerprint(self):
+        return self.version
+
+    def load(self, formatter=None):
+        self.data = dict((self.format(k, formatter), v) for k, v in self.source.items())
+
+
+def adapters(count, version=None):
+    return [DictAdapter(dict(('key_{0}_{1}'.format(index, key), key) for key in range(KEYS)), version)
+            for index in range(count)]
+
+
+@benchmark('config.load', params=[1, 10, 50])
+def config_load(count):
+    """Loads adapters of 100 keys each"""
+    config = Config(None, None, None, *adapters(count))
+    yield config.load
+
+
+@benchmark('config.reload', params=[1, 10, 50])
+def config_reload(count):
+    """Reloads adapters whose source didn't change"""
+    config = Config(None, None, None, *adapters(count, version=1))
+    config.load()
+    yield config.load
+
+
+@benchmark('config.getitem', params=['top-level', 'dotted'])
+def config_getitem(param):
+    config = Config({"database": {"primary": {"host": "localhost"}}})
+    config.load()
+    key = 'DATABASE' if param == 'top-level' else 'DATABASE.primary.host'
+
+    yield lambda: config[key]
+
+
+@benchmark('config.subconfigs.load', params=[1, 10, 50])
+def config_subconfigs_load(count):
+    """Loads a config cascading its formatter to subconfigs"""
+    config = Config({"abc": "123"})
+    for index in range(count):
+        config.add_subconfig('sub_{0}'.format(index),
+                             Config(Defaults(dict(('key_{0}'.format(key), key) for key in range(KEYS)))))
+
+    yield config.load
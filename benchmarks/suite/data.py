@@ -0,0 +1,58 @@
+"""Generated configuration documents and files, shared by the suite benchmarks"""
+import os
+import json
+import tempfile
+
+import yaml
+
+
+UNITS = {'KB': 1024, 'MB': 1024 ** 2}
+
+
+def parse_size(size):
+    """Returns the number of bytes of a size such as 100KB"""
+    return int(size[:-2]) * UNITS[size[-2:]]
+
+
+def document(size):
+    """Returns a document of about size bytes once serialized as JSON"""
+    data, written, index = {}, 0, 0
+    while written < size:
+        section = {
+            "hosts": ["10.0.{0}.{1}".format(index % 256, i) for i in range(8)],
+            "port": 8000 + index,
+            "ratio": index / 7.0,
+            "enabled": index % 2 == 0,
+            "labels": {"name": "section {0}".format(index), "owner": None},
+        }
+        data["section_{0}".format(index)] = section
+        written += len(json.dumps(section))
+        index += 1
+
+    return data
+
+
+def write_file(data, extension):
+    """Writes data to a temporary file in the format extension stands for
+
+    :returns: the file path, to be removed by the caller
+    """
+    fd = tempfile.NamedTemporaryFile(mode='w', suffix=extension, delete=False)
+    with fd:
+        if extension == '.json':
+            json.dump(data, fd)
+        elif extension == '.yaml':
+            Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+            yaml.dump(data, fd, Dumper=Dumper)
+        elif extension == '.py':
+            for key, value in data.items():
+                fd.write('{0} = {1!r}\n'.format(key.upper(), value))
+        else:
+            raise ValueError("Unhandled file extension {0}".format(extension))
+
+    return fd.name
+
+
+def remove(path):
+    if os.path.exists(path):
+        os.remove(path)
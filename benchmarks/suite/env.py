@@ -0,0 +1,27 @@
+import os
+
+from etcaetera.adapter import Env
+
+from harness import benchmark
+
+
+@benchmark('env.load', params=['keys-100', 'prefix-100', 'keys-1000', 'prefix-1000',
+                               'keys-10000', 'prefix-10000'])
+def env_load(param):
+    """Loads variables out of an environment holding as many unrelated ones"""
+    mode, count = param.split('-')
+    names = ['BENCH_APP_SETTING_{0}'.format(index) for index in range(int(count))]
+    others = ['BENCH_OTHER_{0}'.format(index) for index in range(int(count))]
+    for name in names + others:
+        os.environ[name] = 'value'
+
+    if mode == 'keys':
+        adapter = Env(*names)
+    else:
+        adapter = Env(prefix='BENCH_APP_', strip_prefix=False)
+
+    try:
+        yield adapter.load
+    finally:
+        for name in names + others:
+            del os.environ[name]
@@ -0,0 +1,43 @@
+from etcaetera import cache, parsers
+from etcaetera.adapter import File
+
+from harness import benchmark
+from suite.data import parse_size, document, write_file, remove
+
+
+def loaded_file(param):
+    extension, size = param.split('-')
+    path = write_file(document(parse_size(size)), '.' + extension)
+    return path, File(path)
+
+
+@benchmark('file.load',
+           params=['json-1KB', 'json-100KB', 'json-10MB',
+                   'yaml-1KB', 'yaml-100KB',
+                   'py-1KB', 'py-100KB'],
+           full_params=['json-100MB', 'yaml-10MB', 'py-10MB'])
+def file_load(param):
+    """Parses a file, caches being cleared before each load"""
+    path, adapter = loaded_file(param)
+
+    def load():
+        cache.documents.clear()
+        parsers._python_code_cache.clear()
+        adapter.load()
+
+    try:
+        yield load
+    finally:
+        remove(path)
+
+
+@benchmark('file.load.cached', params=['json-100KB', 'yaml-100KB', 'py-100KB'])
+def file_load_cached(param):
+    """Loads an unchanged file, served by the document cache"""
+    path, adapter = loaded_file(param)
+    adapter.load()
+
+    try:
+        yield adapter.load
+    finally:
+        remove(path)
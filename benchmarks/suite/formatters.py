@@ -0,0 +1,40 @@
+from etcaetera.adapter import Adapter
+from etcaetera.formatters import uppercased, environ, cached_format, format_cache
+
+from harness import benchmark
+
+
+KEYS = ['key_{0}'.format(key) for key in range(100)]
+
+
+@benchmark('format', params=['uppercased', 'environ'])
+def format_uncached(param):
+    """Formats 100 keys calling the formatter"""
+    formatter = uppercased if param == 'uppercased' else environ
+    yield lambda: dict((formatter(key), key) for key in KEYS)
+
+
+@benchmark('format.cached_format', params=['uppercased', 'environ'])
+def format_cached_format(param):
+    """Formats 100 keys already formatted once, one call per key"""
+    formatter = uppercased if param == 'uppercased' else environ
+    yield lambda: dict((cached_format(formatter, key), key) for key in KEYS)
+
+
+@benchmark('format.format_cache', params=['uppercased', 'environ'])
+def format_format_cache(param):
+    """Formats 100 keys already formatted once, looking them up in the formatter cache"""
+    formatter = uppercased if param == 'uppercased' else environ
+
+    def run():
+        formatted = format_cache(formatter)
+        return dict((formatted[key], key) for key in KEYS)
+
+    yield run
+
+
+@benchmark('format.adapter', params=['uppercased', 'environ'])
+def format_adapter(param):
+    """Formats 100 keys through Adapter.format, as third-party adapters do"""
+    adapter = Adapter(formatter=uppercased if param == 'uppercased' else environ)
+    yield lambda: dict((adapter.format(key), key) for key in KEYS)
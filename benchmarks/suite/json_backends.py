@@ -0,0 +1,44 @@
+from etcaetera import cache
+from etcaetera.adapter import File
+from etcaetera.parsers import json_backend_loads
+from etcaetera.constants import JSON_BACKENDS
+
+from harness import benchmark
+from suite.data import parse_size, document, write_file, remove
+
+
+def installed(backend):
+    try:
+        json_backend_loads(backend)
+    except ImportError:
+        return False
+    return True
+
+
+BACKENDS = [backend for backend in JSON_BACKENDS if installed(backend)]
+
+
+@benchmark('json_backend.load',
+           params=['{0}-{1}'.format(backend, size) for size in ('1MB', '4MB') for backend in BACKENDS],
+           full_params=['{0}-100MB'.format(backend) for backend in BACKENDS])
+def json_backend_load(param):
+    """Parses a JSON file with each installed backend"""
+    backend, size = param.split('-')
+    path = write_file(document(parse_size(size)), '.json')
+    adapter = File(path, json_backend=backend)
+
+    def load():
+        cache.documents.clear()
+        adapter.load()
+
+    try:
+        # Backends must agree on the parsed data
+        load()
+        reference = File(path, json_backend='json')
+        cache.documents.clear()
+        reference.load()
+        assert adapter.data == reference.data, "{0} results differ from json".format(backend)
+
+        yield load
+    finally:
+        remove(path)
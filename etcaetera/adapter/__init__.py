@@ -1,7 +1,31 @@
-from .base import *
-from .defaults import *
-from .env import * 
-from .file import *
-from .module import *
-from .overrides import * 
-from .set import *
+import importlib
+
+
+# Adapters are imported on first access only, so that importing
+# etcaetera doesn't pay for the adapters, and their parsers, it never uses.
+_adapters_modules = {
+    'Adapter': 'base',
+    'Defaults': 'defaults',
+    'Env': 'env',
+    'File': 'file',
+    'Module': 'module',
+    'Overrides': 'overrides',
+    'AdapterSet': 'set',
+}
+
+__all__ = sorted(_adapters_modules)
+
+
+def __getattr__(name):
+    if name not in _adapters_modules:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+    module = importlib.import_module('.' + _adapters_modules[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,23 @@
-from collections import defaultdict
-
 try:
-    from functools import reduce
+    from collections.abc import Mapping
 except ImportError:
-    pass
-
-from etcaetera.utils import is_nested_key
-from etcaetera.formatters import uppercased
+    from collections import Mapping
 
-
-Tree = lambda: defaultdict(Tree)
+from etcaetera.utils import split_key
+from etcaetera.formatters import uppercased, cached_format
 
 
 class Adapter(object):
+    # Measurements of the last load, by adapters telling reading their
+    # source apart from parsing it: None for the others.
+    io_time = None
+    parse_time = None
+    bytes_read = None
+
     def __init__(self, formatter=None, strict=False, *keys, **mapping):
-        self.data = Tree()
+        # Nested plain dicts: intermediate nodes are only ever
+        # created by item assignment, never by lookups.
+        self.data = {}
         self.formatter = formatter or uppercased
         self.strict = strict
 
@@ -27,28 +30,79 @@ class Adapter(object):
     def __repr__(self):
         return '<{0} {1}>'.format(self.__str__(), id(self))
 
+    # Dotted keys paths are memoized by split_key. Walking the data
+    # never creates nodes, even in defaultdicts.
     def __getitem__(self, key):
-        if is_nested_key(key):
-            subkeys = key.split('.')
-            return reduce(lambda d, k: d[k], subkeys, self.data)
+        node = self.data
+        for subkey in split_key(key):
+            if not isinstance(node, Mapping) or subkey not in node:
+                raise KeyError(key)
+            node = node[subkey]
 
-        return self.data[key]
+        return node
 
     def __setitem__(self, key, value):
-        if is_nested_key(key):
-            subkeys = key.split('.')
-
-            reduce(lambda d, k: d[k], subkeys[:-1], self.data)[subkeys[-1]] = value
-            return
-
-        self.data[key] = value
+        subkeys = split_key(key)
+
+        node = self.data
+        for subkey in subkeys[:-1]:
+            if subkey not in node:
+                node[subkey] = {}
+            node = node[subkey]
+        node[subkeys[-1]] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        """Returns the value of a top-level or dotted key, or default"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     def strictness_check(self):
         pass
 
     def format(self, key, formatter=None):
-        formatter = formatter or self.formatter
-        return formatter(key)
+        return cached_format(formatter or self.formatter, key)
+
+    def fingerprint(self):
+        """Returns a cheap token identifying the adapter source current state
 
-    def load(self):
+        Whenever two successive calls return the same, non None, token,
+        the adapter source is considered unchanged, and the data it
+        previously loaded are reused instead of being loaded again.
+        None means the source state can't be cheaply determined, and the
+        adapter should always be loaded.
+        """
+        return None
+
+    def persistent_fingerprint(self):
+        """Returns a token identifying the adapter source state across processes
+
+        It is used to validate configs cached on disk. None means the
+        adapter can't be persistently cached.
+        """
+        return self.fingerprint()
+
+    def load(self, formatter=None):
         raise NotImplementedError
+
+    async def aload(self, formatter=None, **options):
+        """Asynchronous counterpart of the load method
+
+        Adapters able to fetch their data without blocking should
+        override it. By default, the synchronous load method is run
+        in the event loop default executor, along with the keyword
+        arguments given, such as a File projection.
+        """
+        import asyncio
+        import functools
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(self.load, formatter=formatter, **options))
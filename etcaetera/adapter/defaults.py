@@ -1,4 +1,5 @@
 from etcaetera.adapter.base import Adapter
+from etcaetera.formatters import format_cache
 from etcaetera.utils import format_key
 
 
@@ -8,5 +9,9 @@ class Defaults(Adapter):
         self.data = data
         self.load()
 
+    def persistent_fingerprint(self):
+        return repr(self.data)
+
     def load(self, formatter=None):
-        self.data = dict((self.format(k, formatter), v) for k,v in self.data.items())
+        formatted = format_cache(formatter or self.formatter)
+        self.data = dict((formatted[k], v) for k, v in self.data.items())
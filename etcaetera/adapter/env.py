@@ -21,20 +21,85 @@ class Env(Adapter):
 
     :param  mapping: key to be fetched from env to adapter destination mapping
     :type   mapping: **kwargs
+
+    To fetch every variable starting with a given prefix instead, such
+    as APP_, provide it as the prefix parameter. Unless strip_prefix is
+    False, it is removed from the adapter keys. When separator is set,
+    variables names are split on it into nested keys: APP__DB__HOST
+    is exposed as DB.HOST with the APP prefix and the __ separator.
+
+    :param  prefix: prefix of the keys to be fetched from system environment
+    :type   prefix: str
+
+    :param  strip_prefix: whether to remove the prefix from adapter keys
+    :type   strip_prefix: bool
+
+    :param  separator: separator of nested keys in variables names
+    :type   separator: str
     """
-    def __init__(self, *keys, **mapping):
+    def __init__(self, *keys, prefix=None, strip_prefix=True, separator=None, **mapping):
         super(Env, self).__init__()
         self.keys = [format_key(k) for k in keys]
         self.mapping = dict((format_key(k), format_key(v)) for k, v in mapping.items())
+        self.prefix = format_key(prefix) if prefix is not None else None
+        self.strip_prefix = strip_prefix
+        self.separator = separator
 
-    def load(self, formatter=None):
+    def fingerprint(self):
         env_keys = self.keys + list(self.mapping.keys())
+        fingerprint = tuple(os.environ.get(key) for key in env_keys)
 
-        for key in [format_key(k) for k in env_keys]:
-            env_value = os.environ.get(format_key(key))
+        if self.prefix is not None:
+            fingerprint += self._scan()
 
+        return fingerprint
+
+    def persistent_fingerprint(self):
+        return (tuple(self.keys), tuple(sorted(self.mapping.items())),
+                self.prefix, self.strip_prefix, self.separator, self.fingerprint())
+
+    def load(self, formatter=None, fingerprint=None):
+        """Loads the selected environment variables
+
+        :param  fingerprint: the adapter fingerprint, when just computed:
+                             it holds the variables values, which are loaded
+                             rather than going through the environment again
+        :type   fingerprint: tuple
+        """
+        env_keys = self.keys + list(self.mapping.keys())
+        if fingerprint is None:
+            fingerprint = self.fingerprint()
+
+        if self.prefix is not None:
+            self._load_prefixed(fingerprint[len(env_keys):])
+
+        for key, env_value in zip(env_keys, fingerprint):
             if env_value is not None:
                 if key in self.mapping:
                     self[self.format(self.mapping[key], self.formatter)] = env_value
                 else:
                     self[self.format(key, self.formatter)] = env_value
+
+    def _scan(self):
+        """Returns the variables matching prefix, in a single environment pass
+
+        Only matching variables values are decoded.
+        """
+        prefix, environ = self.prefix, os.environ
+        return tuple((name, environ[name]) for name in environ if name.startswith(prefix))
+
+    def _load_prefixed(self, scanned):
+        separator = self.separator
+        start = len(self.prefix) if self.strip_prefix else 0
+
+        for name, env_value in scanned:
+            key = name[start:]
+            if separator:
+                # Leftovers of a separator the prefix ends with, if any
+                key = key.lstrip(separator[0]) if start else key
+                subkeys = key.split(separator)
+                if len(subkeys) > 1 and all(subkeys):
+                    key = '.'.join(subkeys)
+
+            if key:
+                self[self.format(key, self.formatter)] = env_value
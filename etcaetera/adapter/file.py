@@ -1,18 +1,47 @@
 import os
-import imp
+import time
 
+from etcaetera import cache
 from etcaetera.adapter.base import Adapter
-from etcaetera.utils import format_key
+from etcaetera.formatters import format_cache
+from etcaetera.utils import format_key, compile_projection, project
+from etcaetera.parsers import (
+    json_stream_load,
+    json_backend_parse,
+    pinned_json_backend,
+    yaml_projected_load,
+    python_settings_load
+)
 from etcaetera.constants import (
     JSON_EXTENSIONS,
     YAML_EXTENSIONS,
-    PYTHON_EXTENSIONS
+    PYTHON_EXTENSIONS,
+    JSON_STREAM_THRESHOLD
 )
 
 
 class File(Adapter):
-    def __init__(self, filepath, *args, **kwargs):
+    """File adapter
+
+    Loads the top-level members of JSON and YAML files, and the uppercased
+    globals of Python files.
+
+    :param  filepath: path of the file to load
+    :type   filepath: str
+
+    :param  projection: top-level or dotted keys to keep, the rest of the
+                        file is skipped as early as its format allows
+    :type   projection: list
+
+    :param  json_backend: JSON backend to parse the file with, defaults to
+                          the one pinned using etcaetera.parsers.set_json_backend,
+                          or to the fastest installed one
+    :type   json_backend: str
+    """
+    def __init__(self, filepath, *args, projection=None, json_backend=None, **kwargs):
         self.filepath = filepath
+        self.projection = projection
+        self.json_backend = json_backend
 
         # If strict parameter (inherited from parent) is True,
         # strictness_check routine will be called
@@ -22,7 +51,27 @@ class File(Adapter):
         if not os.path.exists(self.filepath):
             raise IOError("Path {0} does not exist".format(self.filepath))
 
-    def load(self, formatter=None):
+    def fingerprint(self):
+        try:
+            stat = os.stat(self.filepath)
+        except OSError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def persistent_fingerprint(self):
+        # A missing file is a state of its own, and can be cached
+        return (os.path.realpath(self.filepath), self.projection, self.fingerprint())
+
+    def load(self, formatter=None, projection=None):
+        # The adapter own projection has precedence over the one a config
+        # loading it provides.
+        if self.projection is not None:
+            projection = self.projection
+
+        start = time.perf_counter()
+        self.io_time, self.parse_time, self.bytes_read = 0.0, 0.0, 0
+
         try:
             fd = open(self.filepath, 'r')
         except IOError:
@@ -31,22 +80,70 @@ class File(Adapter):
             else:
                 return
 
+        tree, keep = None, None
+        if projection is not None:
+            tree = compile_projection(projection, formatter or self.formatter)
+            keep = lambda key: self.format(key, formatter) in tree
+
+        try:
+            stat = os.fstat(fd.fileno())
+            source = (os.path.realpath(self.filepath), None if tree is None else repr(tree))
+            key = (source, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+            document = cache.documents.get(key)
+            if document is None:
+                document = self._parse(fd, stat, keep)
+                cache.documents.set(key, document, stat.st_size)
+                self.bytes_read = stat.st_size
+        finally:
+            fd.close()
+            self.io_time = time.perf_counter() - start - self.parse_time
+
+        formatted = format_cache(formatter or self.formatter)
+        self.data = dict((formatted[k], v) for k, v in document.items())
+        if tree is not None:
+            self.data = project(self.data, tree)
+
+    def _parse(self, fd, stat, keep=None):
+        """Parses the file, measuring parse_time
+
+        Files parsed as a whole are read beforehand, so that reading them
+        isn't accounted as parsing. Streamed JSON files are read as they
+        are parsed: their parse time includes reading them.
+        """
         _, file_extension = os.path.splitext(self.filepath)
+        start = time.perf_counter()
+
+        try:
+            if file_extension.lower() in JSON_EXTENSIONS:
+                # Skipping members requires the streaming parser, and large
+                # files are streamed unless a backend was explicitly chosen.
+                pinned = self.json_backend or pinned_json_backend()
+                if keep is not None or (stat.st_size >= JSON_STREAM_THRESHOLD and pinned is None):
+                    return json_stream_load(fd, keep=keep)
 
-        if file_extension.lower() in JSON_EXTENSIONS:
-            import json
-            self.data = dict((self.format(k, formatter), v) for k, v in json.load(fd).items())
-        elif file_extension.lower() in YAML_EXTENSIONS:
-            from yaml import load as yload, dump as ydump
-            try:
-                from yaml import CLoader as Loader
-            except ImportError:
-                from yaml import Loader
-            self.data = dict((self.format(k, formatter), v) for k, v in yload(fd, Loader=Loader).items())
-        elif file_extension.lower() in PYTHON_EXTENSIONS:
-            mod = imp.load_source('mod', self.filepath)
-            self.data = dict((self.format(k, formatter), v) for k, v in vars(mod).items() if k.isupper())
-        else:
-            raise ValueError("Unhandled file extension {0}".format(file_extension))
-
-        fd.close()
+                content = fd.buffer.read()
+                start = time.perf_counter()
+                return json_backend_parse(content, pinned)
+            elif file_extension.lower() in YAML_EXTENSIONS:
+                from yaml import load as yload, dump as ydump
+                try:
+                    from yaml import CLoader as Loader
+                except ImportError:
+                    from yaml import Loader
+
+                content = fd.buffer.read()
+                start = time.perf_counter()
+                if keep is not None:
+                    return yaml_projected_load(content, Loader, keep)
+                return yload(content, Loader=Loader)
+            elif file_extension.lower() in PYTHON_EXTENSIONS:
+                content = fd.buffer.read()
+                start = time.perf_counter()
+                namespace = python_settings_load(self.filepath, content, stat.st_mtime_ns)
+                return dict((k, v) for k, v in namespace.items()
+                            if k.isupper() and (keep is None or keep(k)))
+            else:
+                raise ValueError("Unhandled file extension {0}".format(file_extension))
+        finally:
+            self.parse_time = time.perf_counter() - start
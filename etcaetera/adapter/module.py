@@ -1,3 +1,4 @@
+import os
 import types
 
 from etcaetera.adapter.base import Adapter
@@ -14,3 +15,17 @@ class Module(Adapter):
     def load(self, formatter=None):
         self.data = dict((self.format(k, formatter), v) for k,v in vars(self.module).items()
                      if k.isupper())
+
+    def persistent_fingerprint(self):
+        # Module attributes changed at runtime can't be detected,
+        # only changes to the module source file are.
+        filepath = getattr(self.module, '__file__', None)
+        if filepath is None:
+            return None
+
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+
+        return (self.module.__name__, filepath, stat.st_mtime_ns, stat.st_size, stat.st_ino)
@@ -0,0 +1,187 @@
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+from etcaetera.utils import copy_nested
+from etcaetera.constants import (
+    DOCUMENT_CACHE_SIZE,
+    DOCUMENT_CACHE_BYTES
+)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize', 'maxbytes', 'currbytes'])
+
+
+class DocumentCache(object):
+    """Process-wide LRU cache of parsed configuration files
+
+    Documents are keyed by their source, identified by the file realpath
+    and the projection it was parsed with, and by the file (mtime, size,
+    inode), so a file is parsed once per change, however many File
+    adapters load it. As measuring parsed documents memory footprint would cost
+    about as much as parsing them, the memory cap applies to the size
+    of the files they were parsed from.
+
+    Every get returns a copy of the cached document, which File adapters
+    and configs are free to modify. Documents are stored marshalled
+    whenever they can be, as unmarshalling them costs less than copying
+    them, and their marshalled form takes less memory. Other documents
+    are stored as is, and have their nested dicts and lists copied.
+
+    :param  maxsize: maximum number of cached documents
+    :type   maxsize: int
+
+    :param  maxbytes: maximum cumulated size of the cached documents files
+    :type   maxbytes: int
+    """
+    def __init__(self, maxsize=DOCUMENT_CACHE_SIZE, maxbytes=DOCUMENT_CACHE_BYTES):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.currbytes = 0
+
+        self._documents = OrderedDict()
+        self._keys_by_source = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def get(self, key):
+        """Returns the document cached for key, or None"""
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._documents.move_to_end(key)
+            self.hits += 1
+
+        stored, marshalled = entry[0], entry[2]
+        if marshalled:
+            import marshal
+            return marshal.loads(stored)
+        return copy_nested(stored)
+
+    def set(self, key, document, size):
+        """Caches document parsed from a file of size bytes, identified by key"""
+        if size > self.maxbytes or self.maxsize <= 0:
+            return
+
+        # The caller keeps document: the cache stores a copy of its own
+        import marshal
+        try:
+            stored, marshalled = marshal.dumps(document), True
+        except ValueError:
+            stored, marshalled = copy_nested(document), False
+
+        with self._lock:
+            # Previous versions of the source can't be hit anymore
+            previous_key = self._keys_by_source.get(key[0])
+            if previous_key is not None:
+                self._evict(previous_key)
+
+            self._documents[key] = (stored, size, marshalled)
+            self._keys_by_source[key[0]] = key
+            self.currbytes += size
+
+            while len(self._documents) > self.maxsize or self.currbytes > self.maxbytes:
+                self._evict(next(iter(self._documents)))
+
+    def _evict(self, key):
+        size = self._documents.pop(key)[1]
+        self.currbytes -= size
+        if self._keys_by_source.get(key[0]) == key:
+            del self._keys_by_source[key[0]]
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+            self._keys_by_source.clear()
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._documents),
+                         self.maxbytes, self.currbytes)
+
+
+# Shared by every File adapter of the process
+documents = DocumentCache()
+
+
+def compiled_key(formatter, adapters, *options):
+    """Returns a digest of the adapters sources state across processes
+
+    :returns: the digest, or None if any adapter can't be persistently cached
+    """
+    import hashlib
+
+    fingerprints = []
+    for adapter in adapters:
+        fingerprint = adapter.persistent_fingerprint()
+        if fingerprint is None:
+            return None
+
+        adapter_type = type(adapter)
+        fingerprints.append((adapter_type.__module__, adapter_type.__name__, fingerprint))
+
+    formatter_name = (getattr(formatter, '__module__', None),
+                      getattr(formatter, '__qualname__', repr(formatter)))
+    source = repr((formatter_name, options, fingerprints))
+
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+class CompiledCache(object):
+    """On-disk cache of a fully loaded config data
+
+    Data are pickled along with the compiled_key of the sources they
+    were loaded from, and are only returned as long as the key matches.
+    As unpickling can execute arbitrary code, the cache file should only
+    be writable by the user running the application.
+
+    :param  path: cache file path
+    :type   path: str
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, key):
+        """Returns the data cached for key, or None"""
+        import pickle
+
+        try:
+            with open(self.path, 'rb') as fd:
+                cached_key, data = pickle.load(fd)
+        except Exception:
+            # Missing, unreadable or corrupted cache files are plain misses
+            return None
+
+        if cached_key != key:
+            return None
+
+        return data
+
+    def dump(self, key, data):
+        """Atomically replaces the cache file content with data, under key
+
+        :returns: whether data could be cached
+        """
+        import pickle
+
+        tmp_path = '{0}.{1}.tmp'.format(self.path, os.getpid())
+
+        try:
+            with open(tmp_path, 'wb') as fd:
+                pickle.dump((key, data), fd, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        return True
@@ -1,6 +1,18 @@
-from collections import deque, namedtuple
+import time
+import types
+import weakref
+import threading
+from collections import deque, namedtuple, ChainMap
 
-from etcaetera.formatters import uppercased
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from etcaetera.formatters import uppercased, format_cache
+from etcaetera.utils import split_key, deep_update, compile_projection, project
+from etcaetera.views import LazyView, DeepChainMap, _missing
+from etcaetera.cache import CompiledCache, compiled_key
 from etcaetera.adapter import (
     Adapter,
     AdapterSet,
@@ -10,10 +22,50 @@ from etcaetera.adapter import (
 )
 
 
+AdapterLoadStats = namedtuple('AdapterLoadStats', ['adapter', 'wall_time', 'io_time', 'parse_time',
+                                                   'keys', 'bytes_read', 'cached'])
+LoadStats = namedtuple('LoadStats', ['wall_time', 'cached', 'adapters', 'subconfigs'])
+
+
 class Config(dict):
-    def __init__(self, defaults=None, overrides=None, formatter=None, *adapters):
+    # Mapping the config data are read through, when not stored
+    # in the config itself, see the lazy and layered modes.
+    _view = None
+
+    # Read-only mapping of the config data as of its last load
+    _snapshot = None
+
+    # Mappings holding the values of the dotted keys resolved since the
+    # config was last loaded or written, by key, see _lookup.
+    _index = None
+
+    # Load hooks of the configs this one is a subconfig of
+    _inherited_hooks = ()
+
+    def __init__(self, defaults=None, overrides=None, formatter=None, *adapters,
+                 workers=None, lazy=False, layered=False, cache_path=None,
+                 projection=None, deep_merge=False, persistent=False, schema=None,
+                 intern=False):
         self.formatter = formatter or uppercased
+        self.workers = workers
+        self.lazy = lazy
+        self.layered = layered
+        self.cache_path = cache_path
+        self.projection = projection
+        self.deep_merge = deep_merge
+        self.persistent = persistent
+        self.schema = schema
+        self.intern = intern
         self._subconfigs = {}
+        self._written = {}
+        self._index = {}
+        self._adapters_cache = weakref.WeakKeyDictionary()
+        self._frozen = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+        self.load_hooks = []
+        self._load_time = None
+        self._loaded_from_cache = False
+        self._adapters_stats = {}
 
         self.adapters = AdapterSet(*adapters)
 
@@ -23,6 +75,176 @@ class Config(dict):
         if overrides is not None:
             self.overrides = overrides
 
+    # Top-level keys are read right from the dict storage, which is
+    # left empty when the config data are read through a view: dotted
+    # keys, and keys read through views, end up here.
+    def __missing__(self, key):
+        # Dotted keys already resolved, see _lookup
+        try:
+            mapping, subkey = self._index[key]
+        except KeyError:
+            pass
+        else:
+            value = mapping.get(subkey, _missing)
+            if value is not _missing:
+                return value
+
+        value = self._lookup(key)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._lookup(key) is not _missing
+
+    # Layered configs data are read through a chain of layers: writes
+    # go to the top one, holding the values set on the config, through
+    # the chain, as ChainMap writes do. Any write drops the dotted keys
+    # index, as the mappings it points to may have been replaced.
+    def __setitem__(self, key, value):
+        if isinstance(self._view, ChainMap):
+            self._view[key] = value
+        else:
+            super(Config, self).__setitem__(key, value)
+        self._index = {}
+
+    def __delitem__(self, key):
+        if isinstance(self._view, ChainMap):
+            del self._view[key]
+        else:
+            super(Config, self).__delitem__(key)
+        self._index = {}
+
+    def update(self, *args, **kwargs):
+        if isinstance(self._view, ChainMap):
+            self._view.update(*args, **kwargs)
+        else:
+            super(Config, self).update(*args, **kwargs)
+        self._index = {}
+
+    def setdefault(self, key, default=None):
+        if isinstance(self._view, ChainMap):
+            value = self._view.setdefault(key, default)
+        else:
+            value = super(Config, self).setdefault(key, default)
+        self._index = {}
+        return value
+
+    def pop(self, *args):
+        if isinstance(self._view, ChainMap):
+            value = self._view.pop(*args)
+        else:
+            value = super(Config, self).pop(*args)
+        self._index = {}
+        return value
+
+    def popitem(self):
+        if isinstance(self._view, ChainMap):
+            item = self._view.popitem()
+        else:
+            item = super(Config, self).popitem()
+        self._index = {}
+        return item
+
+    def clear(self):
+        if isinstance(self._view, ChainMap):
+            self._view.clear()
+        else:
+            super(Config, self).clear()
+        self._index = {}
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _missing else value
+
+    # Any other read access needs the whole config to be loaded
+    def __iter__(self):
+        view = self._materialized_view()
+        if view is not None:
+            return iter(view)
+
+        return super(Config, self).__iter__()
+
+    def __len__(self):
+        view = self._materialized_view()
+        if view is not None:
+            return len(view)
+
+        return super(Config, self).__len__()
+
+    def __eq__(self, other):
+        if isinstance(other, Config) and other._materialized_view() is not None:
+            # Its own storage doesn't hold its data
+            other = dict(other._materialized_view())
+
+        view = self._materialized_view()
+        if view is not None:
+            return dict(view) == other
+
+        return super(Config, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        view = self._materialized_view()
+        if view is not None:
+            return repr(dict(view))
+
+        return super(Config, self).__repr__()
+
+    def keys(self):
+        view = self._materialized_view()
+        if view is not None:
+            return view.keys()
+
+        return super(Config, self).keys()
+
+    def values(self):
+        view = self._materialized_view()
+        if view is not None:
+            return view.values()
+
+        return super(Config, self).values()
+
+    def items(self):
+        view = self._materialized_view()
+        if view is not None:
+            return view.items()
+
+        return super(Config, self).items()
+
+    def copy(self):
+        view = self._materialized_view()
+        if view is not None:
+            return dict(view)
+
+        return super(Config, self).copy()
+
+    __hash__ = None
+
+    # Copies and unpickled configs store their data themselves, whatever
+    # the mode they were loaded in, and get a lock of their own. Adapters
+    # data caches and frozen objects are weakly referenced, and not kept.
+    _transient = ('_lock', '_view', '_snapshot', '_written', '_index', '_adapters_cache',
+                  '_frozen')
+
+    def __getstate__(self):
+        self._materialized_view()
+
+        state = dict(self.__dict__)
+        for name in self._transient:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._written = {}
+        self._index = {}
+        self._adapters_cache = weakref.WeakKeyDictionary()
+        self._frozen = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+
     def register(self, *adapters):
         """Registers an adapter to be applied by config"""
         for adapter in adapters:
@@ -80,19 +302,584 @@ class Config(dict):
 
         self._adapters = AdapterSet(*value)
 
+    @property
+    def schema(self):
+        return self._schema
+
+    @schema.setter
+    def schema(self, value):
+        # Normalized right away, as the cache_path cache key depends on it
+        if value is not None:
+            from etcaetera.schema import Schema
+
+            if not isinstance(value, Schema):
+                value = Schema(value)
+
+        self._schema = value
+
     def load(self):
+        """Loads adapters and subconfigs, and updates the config with their data
+
+        When the ``workers`` attribute is set, adapters are loaded concurrently
+        using a pool of that many threads. Whatever the loading mode, adapters
+        data are merged in the AdapterSet order, so Defaults are always
+        overridden by the other adapters, and Overrides always win.
+
+        Adapters whose fingerprint didn't change since the previous load
+        are not loaded again: their previously loaded data are merged instead.
+
+        When the ``lazy`` attribute is set, adapters are not loaded right away.
+        Instead, the first lookup of a key loads adapters from the highest
+        precedence one (Overrides) down to the lowest one (Defaults), and
+        stops as soon as the key is found. Any access requiring the whole
+        config, such as iterating over it, loads the remaining adapters.
+        Values set on the config meanwhile win over the adapters ones, as
+        they would if set after an eager load.
+
+        When the ``layered`` attribute is set, adapters data are not merged
+        into the config. Each adapter data is kept as a separate layer
+        instead, and lookups walk the layers from the highest precedence
+        one down. Reloading then only replaces the layers of the adapters
+        whose fingerprint changed. Unlike eager merging, keys removed from
+        an adapter source are dropped from the config on reload. Values set
+        on the config are kept in a layer of their own, on top of the others,
+        until adapters provide them on reload, as with eager merging.
+
+        When the ``cache_path`` attribute is set, loaded data are cached on
+        disk at this path, along with a digest of every adapter source state.
+        As long as no source changes, loads then read the cached data in one
+        step instead of loading the adapters.
+
+        When the ``projection`` attribute is set to a list of top-level or
+        dotted keys, only these keys are kept. File adapters without their
+        own projection are loaded with the config one, so that they can skip
+        the rest of their file while parsing it.
+
+        When the ``deep_merge`` attribute is set, nested mappings adapters
+        provide under the same key are merged key by key, instead of the
+        higher precedence one replacing the others. Merged mappings are
+        copied, along the overlapping paths only: every other value is
+        shared with the adapters data.
+
+        When the ``persistent`` attribute is set, snapshots are persistent
+        maps (see etcaetera.persistent) rather than copies of the config:
+        each load snapshot shares every entry it didn't change with the
+        previous one, so keeping many versions of the config around is cheap.
+
+        When the ``schema`` attribute is set to an etcaetera.schema.Schema,
+        or to a dict of fields, config values are coerced to their field
+        type, missing ones set to their default, and constraints checked,
+        before being published: a ValidationError is raised if they don't
+        conform. As validation needs every key, lazy configs with a schema
+        are loaded eagerly.
+
+        When the ``intern`` attribute is set, adapters values are replaced
+        by canonical instances from an etcaetera.interning.InternPool, so
+        that configs loading equal values share them. Set it to True to
+        use the process-wide pool, or to the pool to use.
+
+        Every load is measured, see load_stats, and calls the hooks
+        registered using add_load_hook around each adapter load.
+        """
+        start = time.perf_counter()
+        adapters, compiled_cache, key, cached_data = self._start_load()
+
         # Adapters loading
-        for adapter in self.adapters:
-            adapter.load(formatter=self.formatter)
-            formatted_adapter_data = dict((self.formatter(k), v) for k, v in adapter.data.items())
-            self.update(formatted_adapter_data)
+        if cached_data is not None:
+            self._publish([cached_data])
+        elif self.lazy and self.schema is None:
+            with self._lock:
+                # Previous data are moved aside, for lookups to go through the view
+                previous = dict(dict.items(self))
+                dict.clear(self)
+                view = self._view = LazyView(self, adapters, previous)
+                self._index = {}
+
+            # Frozen objects are updated in place, with every value they expose
+            if self._frozen:
+                view.materialize()
+        else:
+            published = self._publish(self._load_adapters(adapters))
+            if key is not None:
+                compiled_cache.dump(key, dict(published))
 
         # Subconfigs loading
         for subconfig in self._subconfigs.values():
-            # If sub configs haven't set their own formatter,
-            # ensure to cascade Config formatter to sub config objects
-            if subconfig.formatter is None and self.formatter is not None:
-                subconfig.formatter = self.formatter
-
+            self._cascade(subconfig)
             subconfig.load()
 
+        self._load_time = time.perf_counter() - start
+
+    async def aload(self):
+        """Asynchronous counterpart of the load method
+
+        Adapters and subconfigs are all awaited concurrently, using their
+        aload method, and adapters data are then merged in the AdapterSet
+        order, exactly as load does, cache_path and projection included.
+        As lazily loading adapters on lookup would block the event loop,
+        lazy configs are loaded right away.
+        """
+        import asyncio
+
+        start = time.perf_counter()
+        adapters, compiled_cache, key, cached_data = self._start_load()
+
+        subconfigs = list(self._subconfigs.values())
+        for subconfig in subconfigs:
+            self._cascade(subconfig)
+
+        if cached_data is not None:
+            adapters = []
+        results = await asyncio.gather(
+            *([self._aload_adapter(adapter) for adapter in adapters] +
+              [subconfig.aload() for subconfig in subconfigs])
+        )
+
+        if cached_data is not None:
+            self._publish([cached_data])
+        else:
+            published = self._publish(results[:len(adapters)])
+            if key is not None:
+                compiled_cache.dump(key, dict(published))
+
+        self._load_time = time.perf_counter() - start
+
+    def add_load_hook(self, before=None, after=None):
+        """Registers callbacks called around each adapter load
+
+        before is called with the config and the adapter about to be
+        loaded. after is called with the config, the adapter, its
+        AdapterLoadStats and None once it is loaded, or with None and
+        the raised exception if it failed to. Subconfigs adapters loads
+        call the hooks of the configs loading them too.
+
+        When the ``workers`` attribute is set, hooks are called from the
+        threads loading the adapters.
+        """
+        self.load_hooks.append((before, after))
+
+    def load_stats(self):
+        """Returns the measurements of the last load, as LoadStats
+
+        LoadStats hold the load wall time, whether data were read from
+        the cache_path cache, the AdapterLoadStats of the loaded adapters,
+        in the AdapterSet order, and the subconfigs LoadStats, by name.
+        AdapterLoadStats hold:
+
+        * wall_time: time spent loading the adapter
+        * io_time and parse_time: time spent reading its source, and
+          parsing it, for adapters measuring them, such as File, None
+          for the others
+        * keys: number of top-level keys loaded
+        * bytes_read: size of the source read, or None
+        * cached: whether the previously loaded data were reused, the
+          adapter source being unchanged
+
+        Lazily loaded adapters stats are added as they are loaded.
+        """
+        return LoadStats(
+            self._load_time,
+            self._loaded_from_cache,
+            [self._adapters_stats[adapter] for adapter in self.adapters
+             if adapter in self._adapters_stats],
+            dict((name, subconfig.load_stats()) for name, subconfig in self._subconfigs.items()),
+        )
+
+    def snapshot(self):
+        """Returns a read-only view of the config data as of its last load
+
+        Each load publishes a new snapshot, rather than updating the
+        previous one, so a snapshot never changes: holding on to it
+        provides consistent reads, even while the config is reloaded.
+        """
+        self._materialized_view()
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = types.MappingProxyType(dict(dict.items(self)))
+        return snapshot
+
+    def freeze_to_object(self, *keys, **attributes):
+        """Returns an object exposing config values as plain attributes
+
+        The object class is generated with a slot per attribute, so that
+        reading a value is a mere attribute load. Its attributes are read
+        only, and updated in place by every subsequent load: as they are
+        updated one after the other, use snapshot to read several values
+        consistently while the config is reloaded. As they need every
+        value, lazy configs are loaded right away as long as any exists.
+
+        Keys are exposed under their own name, dots replaced with
+        underscores, and keyword arguments map attributes names to keys.
+        When neither is provided, every top-level key which is a valid
+        attribute name is exposed, along with the subconfigs.
+
+        :raises: KeyError if a key is missing, ValueError if it can't be
+                 exposed as an attribute, or if its attribute name is a
+                 subconfig one
+        """
+        from etcaetera.frozen import frozen_class, attribute_name, is_attribute_name
+
+        self._materialized_view()
+
+        subconfigs = {}
+        if not keys and not attributes:
+            keys = [key for key in self if is_attribute_name(key)]
+            subconfigs = self._subconfigs
+
+        mapping = dict((attribute_name(key), key) for key in keys)
+        mapping.update(attributes)
+        for key in mapping.values():
+            if key not in self:
+                raise KeyError(key)
+        for name in subconfigs:
+            if name in mapping:
+                raise ValueError("{0} is both a key and a subconfig attribute".format(name))
+
+        frozen = frozen_class(tuple(sorted(mapping)) + tuple(sorted(subconfigs)))()
+        for name, subconfig in subconfigs.items():
+            object.__setattr__(frozen, name, subconfig.freeze_to_object())
+
+        with self._lock:
+            self._update_frozen(frozen, mapping)
+            self._frozen[frozen] = mapping
+
+        return frozen
+
+    def watch(self, **kwargs):
+        """Starts reloading the config whenever its File adapters sources change
+
+        Keyword arguments are passed to the etcaetera.watcher.Watcher
+        constructor.
+
+        :returns: the started Watcher, stop it using its stop method
+        """
+        from etcaetera.watcher import Watcher
+
+        watcher = Watcher(self, **kwargs)
+        watcher.start()
+        return watcher
+
+    def _start_load(self):
+        """Resets the load measurements, and looks up the cache_path cache
+
+        :returns: the adapters to load, the compiled cache and the key
+                  their data are cached under, and the cached data, if any
+        """
+        self._adapters_stats = {}
+        adapters = list(self.adapters)
+
+        compiled_cache, key, cached_data = None, None, None
+        if self.cache_path is not None:
+            compiled_cache = CompiledCache(self.cache_path)
+            key = compiled_key(self.formatter, adapters, self.layered, self.projection,
+                               self.deep_merge, self.schema)
+            if key is not None:
+                cached_data = compiled_cache.load(key)
+
+        self._loaded_from_cache = cached_data is not None
+        return adapters, compiled_cache, key, cached_data
+
+    def _cascade(self, subconfig):
+        # If sub configs haven't set their own formatter,
+        # ensure to cascade Config formatter to sub config objects
+        if subconfig.formatter is None and self.formatter is not None:
+            subconfig.formatter = self.formatter
+
+        # Same goes for the concurrent loading workers count
+        if subconfig.workers is None and self.workers is not None:
+            subconfig.workers = self.workers
+
+        # Hooks observe subconfigs adapters loads as well
+        subconfig._inherited_hooks = self._inherited_hooks + tuple(self.load_hooks)
+
+    def _lookup(self, key):
+        """Returns the value of a top-level or dotted key, or _missing
+
+        Dotted keys are resolved by walking the nested data from their
+        first key, so that lazy configs only load the adapters needed to
+        find it. Top-level keys holding dots are looked up as is too.
+
+        Once resolved, the mapping holding a dotted key value is indexed,
+        so that reading it again is a lookup in that mapping: values set
+        in it in place are read, but not the sections it is replaced with
+        in place, until the next load or write to the config.
+        """
+        # Writes drop the index, so keys set since can't be shadowed
+        index = self._index
+        try:
+            mapping, subkey = index[key]
+        except KeyError:
+            pass
+        else:
+            value = mapping.get(subkey, _missing)
+            if value is not _missing:
+                return value
+
+        # Keys set on a lazy config are stored in the config itself
+        value = dict.get(self, key, _missing)
+        if value is not _missing:
+            return value
+
+        view = self._view
+        if not isinstance(key, str) or '.' not in key:
+            return _missing if view is None else view.get(key, _missing)
+
+        path = split_key(key)
+        parent = self._walk(path[:-1])
+        if type(parent) is dict or isinstance(parent, Mapping):
+            value = parent.get(path[-1], _missing)
+            # Lazy configs data are only complete once published
+            if value is not _missing and not isinstance(view, LazyView):
+                index[key] = (parent, path[-1])
+
+        if value is _missing and view is not None:
+            value = view.get(key, _missing)
+        return value
+
+    def _walk(self, path):
+        value = dict.get(self, path[0], _missing)
+        if value is _missing and self._view is not None:
+            value = self._view.get(path[0], _missing)
+
+        for subkey in path[1:]:
+            if type(value) is not dict and not isinstance(value, Mapping):
+                return _missing
+            value = value.get(subkey, _missing)
+
+        return value
+
+    def _materialized_view(self):
+        """Returns the view config data are read through, if any
+
+        Adapters pending to be lazily loaded are loaded first.
+        """
+        view = self._view
+        if isinstance(view, LazyView):
+            return view.materialize()
+
+        return view
+
+    def _publish(self, layers):
+        """Exposes adapters formatted data, sorted by increasing precedence
+
+        :returns: the merged adapters data, schema typed values included,
+                  but not the values set on the config
+        """
+        with self._lock:
+            if self.layered:
+                chain_class = DeepChainMap if self.deep_merge else ChainMap
+                view = chain_class(*reversed(layers))
+                if self.schema is not None:
+                    # Typed values shadow every layer
+                    view = view.new_child(self._validate(view))
+
+                # Values set on the config are kept, as with eager loading,
+                # unless the adapters provide them. Writes made while lazily
+                # loading are in the dict storage, which lookups must miss.
+                written = self._written
+                written.update(dict.items(self))
+                dict.clear(self)
+                for key in [key for key in written if key in view]:
+                    del written[key]
+
+                published = view.new_child(dict(written))
+                if self.persistent:
+                    self._snapshot = self._persistent_version(published)
+                else:
+                    self._snapshot = types.MappingProxyType(published)
+                self._view = view.new_child(written)
+                self._index = {}
+                self._refresh_frozen()
+                return view
+            else:
+                merged = {}
+                for formatted_adapter_data in layers:
+                    if self.deep_merge:
+                        deep_update(merged, formatted_adapter_data)
+                    else:
+                        merged.update(formatted_adapter_data)
+
+                if self.schema is not None:
+                    merged.update(self._validate(merged))
+
+                # Update the config in a single step, then swap the snapshot
+                dict.update(self, merged)
+                self._view = None
+                if self.persistent:
+                    self._snapshot = self._persistent_version(self)
+                else:
+                    self._snapshot = types.MappingProxyType(dict(dict.items(self)))
+                self._index = {}
+                self._refresh_frozen()
+                return merged
+
+    def _refresh_frozen(self):
+        """Updates the objects returned by freeze_to_object with current values"""
+        for frozen, mapping in list(self._frozen.items()):
+            self._update_frozen(frozen, mapping)
+
+    def _update_frozen(self, frozen, mapping):
+        for name, key in mapping.items():
+            value = self._lookup(key)
+            if value is not _missing:
+                object.__setattr__(frozen, name, value)
+            elif hasattr(frozen, name):
+                object.__delattr__(frozen, name)
+
+    def _validate(self, data):
+        """Returns the schema typed values of data, see etcaetera.schema"""
+        return self.schema.validate(data, self.formatter)
+
+    def _persistent_version(self, data):
+        """Returns a persistent map of data
+
+        Only the entries which changed since the previous snapshot are
+        set, or deleted, so both share all the others.
+        """
+        from etcaetera.persistent import Map
+
+        version = self._snapshot
+        if not isinstance(version, Map):
+            return Map(data.items())
+
+        changes = {}
+        for key, value in data.items():
+            previous = version.get(key, _missing)
+            if previous is not value and previous != value:
+                changes[key] = value
+        if changes:
+            version = version.update(changes)
+
+        if len(version) != len(data):
+            for key in [key for key in version if key not in data]:
+                version = version.delete(key)
+
+        return version
+
+    def _load_adapters(self, adapters):
+        """Loads adapters and returns their formatted data, in adapters order"""
+        if self.workers and len(adapters) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            # Executor.map yields results in submission order, whatever
+            # the order adapters loading actually completed in.
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return list(executor.map(self._load_adapter, adapters))
+
+        return [self._load_adapter(adapter) for adapter in adapters]
+
+    def _load_adapter(self, adapter):
+        hooks = self._before_load(adapter)
+        start = time.perf_counter()
+        try:
+            fingerprint = adapter.fingerprint()
+            data = self._cached_adapter_data(adapter, fingerprint)
+            cached = data is not None
+            if not cached:
+                adapter.load(**self._load_options(adapter, fingerprint))
+                data = self._cache_adapter_data(adapter, fingerprint)
+        except Exception as error:
+            self._after_load(hooks, adapter, None, error)
+            raise
+
+        self._record_load(hooks, adapter, start, data, cached)
+        return data
+
+    async def _aload_adapter(self, adapter):
+        hooks = self._before_load(adapter)
+        start = time.perf_counter()
+        try:
+            fingerprint = adapter.fingerprint()
+            data = self._cached_adapter_data(adapter, fingerprint)
+            cached = data is not None
+            if not cached:
+                await adapter.aload(**self._load_options(adapter, fingerprint))
+                data = self._cache_adapter_data(adapter, fingerprint)
+        except Exception as error:
+            self._after_load(hooks, adapter, None, error)
+            raise
+
+        self._record_load(hooks, adapter, start, data, cached)
+        return data
+
+    def _load_options(self, adapter, fingerprint):
+        """Returns the keyword arguments adapter should be loaded with"""
+        options = {'formatter': self.formatter}
+        if isinstance(adapter, Env):
+            # Env fingerprints hold the environment values it loads
+            options['fingerprint'] = fingerprint
+        if self.projection is not None:
+            from etcaetera.adapter.file import File
+
+            if isinstance(adapter, File):
+                options['projection'] = self.projection
+        return options
+
+    def _before_load(self, adapter):
+        """Calls the before load hooks, and returns every hook to call"""
+        hooks = self._inherited_hooks + tuple(self.load_hooks)
+        for before, _ in hooks:
+            if before is not None:
+                before(self, adapter)
+        return hooks
+
+    def _after_load(self, hooks, adapter, stats, error):
+        for _, after in hooks:
+            if after is not None:
+                after(self, adapter, stats, error)
+
+    def _record_load(self, hooks, adapter, start, data, cached):
+        wall_time = time.perf_counter() - start
+        if cached:
+            # Nothing was read nor parsed
+            stats = AdapterLoadStats(adapter, wall_time,
+                                     None if adapter.io_time is None else 0.0,
+                                     None if adapter.parse_time is None else 0.0,
+                                     len(data),
+                                     None if adapter.bytes_read is None else 0,
+                                     True)
+        else:
+            stats = AdapterLoadStats(adapter, wall_time, adapter.io_time, adapter.parse_time,
+                                     len(data), adapter.bytes_read, False)
+
+        self._adapters_stats[adapter] = stats
+        self._after_load(hooks, adapter, stats, None)
+
+    def _cached_adapter_data(self, adapter, fingerprint):
+        """Returns adapter's previously loaded data if its source is unchanged
+
+        Data loaded with another formatter or projection are not reused.
+        """
+        cached = self._adapters_cache.get(adapter)
+        if fingerprint is None or cached is None:
+            return None
+
+        cached_fingerprint, cached_formatter, cached_projection, cached_data = cached
+        if (cached_fingerprint != fingerprint or cached_formatter is not self.formatter or
+                cached_projection != self._projection_key()):
+            return None
+
+        return cached_data
+
+    def _cache_adapter_data(self, adapter, fingerprint):
+        if self.intern is not None and self.intern is not False:
+            from etcaetera import interning
+
+            # Interning the adapter data themselves lets their duplicates go
+            pool = self.intern if isinstance(self.intern, interning.InternPool) else interning.pool
+            pool.intern_data(adapter.data)
+
+        formatted = format_cache(self.formatter)
+        formatted_adapter_data = dict((formatted[k], v) for k, v in adapter.data.items())
+        if self.projection is not None:
+            tree = compile_projection(self.projection, self.formatter)
+            formatted_adapter_data = project(formatted_adapter_data, tree)
+
+        self._adapters_cache[adapter] = (fingerprint, self.formatter, self._projection_key(),
+                                         formatted_adapter_data)
+        return formatted_adapter_data
+
+    def _projection_key(self):
+        return None if self.projection is None else tuple(self.projection)
+
@@ -1,3 +1,27 @@
 JSON_EXTENSIONS = ['.json']
 YAML_EXTENSIONS = ['.yaml', '.yml']
 PYTHON_EXTENSIONS = ['.py']
+
+# Maximum number of formatted keys an etcaetera.formatters.FormatCache
+# remembers, and of formatters whose FormatCache is kept
+FORMAT_CACHE_SIZE = 2 ** 16
+FORMATTERS_CACHE_SIZE = 64
+
+# Maximum number of dotted keys paths etcaetera.utils.split_key remembers
+KEY_PATH_CACHE_SIZE = 2 ** 12
+
+# Maximum number of parsed files, and of their cumulated size in bytes,
+# etcaetera.cache.documents keeps around
+DOCUMENT_CACHE_SIZE = 128
+DOCUMENT_CACHE_BYTES = 64 * 1024 * 1024
+
+# JSON files larger than JSON_STREAM_THRESHOLD bytes are parsed through
+# etcaetera.parsers.json_stream_load, decoding JSON_STREAM_CHUNK_SIZE bytes at a time
+JSON_STREAM_THRESHOLD = 8 * 1024 * 1024
+JSON_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# JSON backends File adapters pick from, fastest first
+JSON_BACKENDS = ['orjson', 'simdjson', 'ujson', 'json']
+
+# Maximum number of distinct values an etcaetera.interning.InternPool holds
+INTERN_POOL_SIZE = 2 ** 16
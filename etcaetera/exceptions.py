@@ -1,2 +1,6 @@
 class MalformationError(Exception):
     pass
+
+
+class ValidationError(Exception):
+    pass
@@ -1,5 +1,11 @@
+import sys
 from collections import namedtuple
 
+from etcaetera.constants import FORMAT_CACHE_SIZE, FORMATTERS_CACHE_SIZE
+
+
+FormatCacheInfo = namedtuple('FormatCacheInfo', ['formatters', 'currsize', 'misses'])
+
 
 def uppercased(s):
     return s.upper()
@@ -11,3 +17,74 @@ def lowercased(s):
 
 def environ(s):
     return s.strip().upper().replace(' ', '_')
+
+
+class FormatCache(dict):
+    """Keys formatted using a formatter, by key
+
+    Keys are formatted on their first lookup only, so that formatting
+    a key again is a mere dict lookup. Formatted strings are interned,
+    so that every adapter and config formatting the same key shares a
+    single string object.
+
+    :param  formatter: function formatting keys
+    :type   formatter: callable
+
+    :param  maxsize: number of formatted keys above which they are
+                     dropped all at once, rather than tracking their use
+    :type   maxsize: int
+    """
+    def __init__(self, formatter, maxsize=FORMAT_CACHE_SIZE):
+        super(FormatCache, self).__init__()
+        self.formatter = formatter
+        self.maxsize = maxsize
+        self.misses = 0
+
+    def __missing__(self, key):
+        formatted = self.formatter(key)
+        if type(formatted) is str:
+            formatted = sys.intern(formatted)
+
+        self.misses += 1
+        if len(self) >= self.maxsize:
+            self.clear()
+        self[key] = formatted
+
+        return formatted
+
+
+# FormatCache of every formatter used, by formatter
+_format_caches = {}
+
+
+def format_cache(formatter):
+    """Returns the FormatCache of formatter, shared process-wide"""
+    cache = _format_caches.get(formatter)
+    if cache is None:
+        if len(_format_caches) >= FORMATTERS_CACHE_SIZE:
+            _format_caches.clear()
+        cache = _format_caches.setdefault(formatter, FormatCache(formatter))
+
+    return cache
+
+
+def cached_format(formatter, key):
+    """Formats key using formatter, remembering the result, see FormatCache
+
+    Formatting many keys is faster looking them up in format_cache(formatter).
+    """
+    try:
+        return _format_caches[formatter][key]
+    except KeyError:
+        return format_cache(formatter)[key]
+
+
+def format_cache_info():
+    """Returns the number of formatters, of formatted keys, and of formatting cache misses"""
+    caches = list(_format_caches.values())
+    return FormatCacheInfo(len(caches), sum(len(cache) for cache in caches),
+                           sum(cache.misses for cache in caches))
+
+
+def format_cache_clear():
+    _format_caches.clear()
@@ -0,0 +1,51 @@
+import keyword
+from functools import lru_cache
+
+
+def attribute_name(key):
+    """Returns the attribute name of a top-level or dotted key
+
+    :raises: ValueError if the key can't be made a valid attribute name
+    """
+    name = key.replace('.', '_')
+    if not name.isidentifier() or keyword.iskeyword(name) or name.startswith('__'):
+        raise ValueError("{0} can't be exposed as an attribute".format(key))
+
+    return name
+
+
+def is_attribute_name(key):
+    return isinstance(key, str) and key.isidentifier() and not keyword.iskeyword(key) \
+        and not key.startswith('__')
+
+
+def _setattr(self, name, value):
+    raise AttributeError("{0} attributes are read-only".format(type(self).__name__))
+
+
+def _delattr(self, name):
+    raise AttributeError("{0} attributes are read-only".format(type(self).__name__))
+
+
+def _repr(self):
+    values = ', '.join('{0}={1!r}'.format(name, getattr(self, name))
+                       for name in self.__slots__ if hasattr(self, name) and name != '__weakref__')
+    return '<{0} {1}>'.format(type(self).__name__, values)
+
+
+@lru_cache(maxsize=None)
+def frozen_class(names):
+    """Returns a class storing the named attributes in slots
+
+    Attributes can't be set through the usual means: the config owning
+    an instance sets them using object.__setattr__.
+
+    :param  names: attributes names
+    :type   names: tuple
+    """
+    return type('FrozenConfig', (object,), {
+        '__slots__': tuple(names) + ('__weakref__',),
+        '__setattr__': _setattr,
+        '__delattr__': _delattr,
+        '__repr__': _repr,
+    })
@@ -0,0 +1,108 @@
+import sys
+import threading
+from collections import namedtuple
+
+from etcaetera.constants import INTERN_POOL_SIZE
+
+
+InternInfo = namedtuple('InternInfo', ['hits', 'misses', 'maxsize', 'currsize', 'saved_bytes'])
+
+# Types of the values worth interning: bool and None are singletons already,
+# and equal containers can't be told apart from distinct ones cheaply.
+INTERNED_TYPES = frozenset([str, bytes, int, float])
+
+
+class InternPool(object):
+    """Pool of canonical instances of immutable values
+
+    Configs loaded using the same pool share a single instance of every
+    equal value their adapters provide, instead of each holding its own
+    copy. Once the pool holds maxsize values, it stops taking new ones,
+    but keeps returning the canonical instances it holds.
+
+    :param  maxsize: maximum number of values held
+    :type   maxsize: int
+    """
+    def __init__(self, maxsize=INTERN_POOL_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def intern(self, value):
+        """Returns the canonical instance of value"""
+        with self._lock:
+            return self._intern(value)
+
+    def intern_data(self, data):
+        """Replaces, in place, a nested mapping values by their canonical instance
+
+        Values of nested dicts and lists are interned too. As replaced
+        values are equal to their canonical instance, data shared with
+        other configs or adapters are not modified in any visible way.
+
+        :returns: data
+        """
+        if not isinstance(data, (dict, list)):
+            return data
+
+        with self._lock:
+            self._intern_container(data)
+        return data
+
+    def _intern(self, value):
+        value_type = value.__class__
+        if value_type not in INTERNED_TYPES:
+            return value
+        if value_type is float and (value != value or value == 0.0):
+            # NaNs are never equal, and 0.0 == -0.0
+            return value
+
+        key = (value_type, value)
+        canonical = self._values.get(key)
+        if canonical is None:
+            self.misses += 1
+            if len(self._values) < self.maxsize:
+                self._values[key] = value
+            return value
+
+        if canonical is not value:
+            self.hits += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return canonical
+
+    def _intern_container(self, container):
+        items = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                self._intern_container(value)
+                continue
+
+            canonical = self._intern(value)
+            if canonical is not value:
+                container[key] = canonical
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+            self.saved_bytes = 0
+
+    def info(self):
+        """Returns the pool statistics
+
+        saved_bytes is the size of the duplicate values replaced by
+        their canonical instance, nested containers excluded.
+        """
+        return InternInfo(self.hits, self.misses, self.maxsize, len(self._values), self.saved_bytes)
+
+
+# Shared by every Config interning values with the default pool
+pool = InternPool()
@@ -0,0 +1,373 @@
+import os
+import re
+
+# Parsing modules (json, mmap, importlib...) are imported by the
+# functions needing them, so that only the formats in use are paid for.
+from etcaetera.constants import JSON_STREAM_CHUNK_SIZE, JSON_BACKENDS
+
+
+# Name of the JSON backend pinned with set_json_backend, if any
+_pinned_json_backend = None
+_detected_json_backend = None
+
+
+def _orjson_loads():
+    import orjson
+    return orjson.loads
+
+
+def _ujson_loads():
+    import ujson
+    return ujson.loads
+
+
+def _simdjson_loads():
+    import simdjson
+    return simdjson.loads
+
+
+def _json_loads():
+    import json
+    return json.loads
+
+
+_json_backends_loaders = {
+    'orjson': _orjson_loads,
+    'ujson': _ujson_loads,
+    'simdjson': _simdjson_loads,
+    'json': _json_loads,
+}
+
+
+def set_json_backend(name):
+    """Pins the JSON backend every File adapter uses, None restores auto-detection"""
+    global _pinned_json_backend
+
+    if name is not None:
+        json_backend_loads(name)
+    _pinned_json_backend = name
+
+
+def pinned_json_backend():
+    return _pinned_json_backend
+
+
+def json_backend_loads(name):
+    """Returns the loads function of the named JSON backend
+
+    :raises: ValueError if the backend is unknown, ImportError if it isn't installed
+    """
+    if name not in _json_backends_loaders:
+        raise ValueError("Unknown JSON backend {0}".format(name))
+
+    return _json_backends_loaders[name]()
+
+
+def detect_json_backend():
+    """Returns the name of the fastest installed JSON backend"""
+    global _detected_json_backend
+
+    if _detected_json_backend is None:
+        for name in JSON_BACKENDS:
+            try:
+                json_backend_loads(name)
+            except ImportError:
+                continue
+            _detected_json_backend = name
+            break
+
+    return _detected_json_backend
+
+
+def json_backend_parse(content, name=None):
+    """Parses JSON content using the named backend
+
+    Defaults to the pinned backend, or to the fastest installed one.
+    Values a fast backend rejects, such as integers beyond 64 bits for
+    orjson, are parsed again by the json module, so that results are
+    the same whatever the backend.
+
+    :param  content: JSON document
+    :type   content: bytes
+    """
+    import json
+
+    name = name or _pinned_json_backend or detect_json_backend()
+    if name == 'json':
+        return json.loads(content)
+
+    try:
+        return json_backend_loads(name)(content)
+    except ValueError:
+        return json.loads(content)
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Runs of characters, and complete strings, skip_value doesn't need to look at
+SKIPPABLE = re.compile(r'(?:[^"\[\]{},]+|"(?:[^"\\]|\\.)*")*')
+
+
+class _MappedText(object):
+    """Incrementally decoded text buffer over a memory mapped file
+
+    Only the part of the file not consumed yet is kept decoded in memory.
+    """
+    def __init__(self, fd, chunk_size=JSON_STREAM_CHUNK_SIZE):
+        import mmap
+        import codecs
+
+        self.map = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.chunk_size = chunk_size
+        self.offset = 0
+        self.text = u''
+        self.pos = 0
+
+    @property
+    def eof(self):
+        return self.offset >= len(self.map)
+
+    def read_more(self):
+        """Decodes at least another chunk of the file
+
+        Chunks grow along with the buffer, so that repeatedly retrying
+        to parse a large value stays linear.
+        """
+        size = max(self.chunk_size, len(self.text) - self.pos)
+        chunk = self.map[self.offset:self.offset + size]
+        self.offset += len(chunk)
+
+        # Drop the consumed part of the buffer on the way
+        self.text = self.text[self.pos:] + self.decoder.decode(chunk, final=self.eof)
+        self.pos = 0
+
+    def skip_whitespace(self):
+        while True:
+            self.pos = WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or self.eof:
+                return
+            self.read_more()
+
+    def peek(self):
+        self.skip_whitespace()
+        return self.text[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        from json import JSONDecodeError
+
+        if self.peek() != char:
+            raise JSONDecodeError("Expecting '{0}'".format(char), self.text, self.pos)
+        self.pos += 1
+
+    def parse(self, parse_once, terminators):
+        """Parses a value at the current position, decoding more text if needed
+
+        :param  parse_once: callable taking the text and a position, and
+                            returning the parsed value and its end position
+        :param  terminators: characters expected to follow the value
+        """
+        from json import JSONDecodeError
+
+        while True:
+            try:
+                value, end = parse_once(self.text, self.pos)
+            except JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # Values such as numbers could have been truncated by the
+                # end of the buffer: only trust values followed by one of
+                # the expected terminators.
+                follow = WHITESPACE.match(self.text, end).end()
+                if self.eof or (follow < len(self.text) and self.text[follow] in terminators):
+                    self.pos = end
+                    return value
+
+            self.read_more()
+
+    def skip_value(self):
+        """Skips the value at the current position without parsing it
+
+        Nested brackets are matched, and strings skipped over, but the
+        skipped value is not otherwise validated.
+        """
+        from json import JSONDecodeError
+
+        depth = 0
+
+        while True:
+            self.pos = SKIPPABLE.match(self.text, self.pos).end()
+            char = self.text[self.pos:self.pos + 1]
+
+            if char in (u'', u'"'):
+                # End of buffer, or string truncated by it
+                if self.eof:
+                    raise JSONDecodeError("Unterminated value", self.text, self.pos)
+                self.read_more()
+            elif char in u'[{':
+                depth += 1
+                self.pos += 1
+            elif depth == 0:
+                # Member separator, or end of the enclosing object
+                return
+            elif char in u']}':
+                depth -= 1
+                self.pos += 1
+            else:
+                self.pos += 1
+
+    def close(self):
+        self.map.close()
+
+
+def json_stream_load(fd, decoder=None, keep=None):
+    """Parses a JSON file through a memory map, one top-level member at a time
+
+    Unlike json.load, the whole file is never held in memory as a string:
+    only the top-level member being parsed is decoded. Peak memory use is
+    thus the parsed document, plus about twice the largest top-level member
+    source text. Files not holding a JSON object are parsed as a whole.
+
+    Top-level members whose key the keep predicate rejects are skipped
+    over without being parsed.
+
+    :param  fd: file object opened on the file to parse
+    :type   fd: file
+
+    :param  decoder: decoder to parse members with, defaults to json.JSONDecoder()
+    :type   decoder: json.JSONDecoder
+
+    :param  keep: predicate selecting top-level members by key, defaults to all
+    :type   keep: callable
+    """
+    import json
+    from json.decoder import scanstring
+
+    decoder = decoder or json.JSONDecoder()
+
+    if os.fstat(fd.fileno()).st_size == 0:
+        # Empty files can't be memory mapped
+        return decoder.decode(u'')
+
+    text = _MappedText(fd)
+    try:
+        if text.peek() != u'{':
+            return decoder.decode(str(text.map, 'utf-8'))
+
+        document = {}
+        text.pos += 1
+
+        if text.peek() == u'}':
+            text.pos += 1
+        else:
+            while True:
+                text.expect(u'"')
+                key = text.parse(lambda s, pos: scanstring(s, pos, decoder.strict), u':')
+                text.expect(u':')
+                text.skip_whitespace()
+                if keep is None or keep(key):
+                    document[key] = text.parse(decoder.raw_decode, u',}')
+                else:
+                    text.skip_value()
+
+                if text.peek() == u'}':
+                    text.pos += 1
+                    break
+                text.expect(u',')
+
+        if text.peek() != u'':
+            raise json.JSONDecodeError("Extra data", text.text, text.pos)
+
+        return document
+    finally:
+        text.close()
+
+
+def yaml_projected_load(fd, Loader, keep):
+    """Parses a YAML file, only constructing the top-level members keep selects
+
+    The whole document is still scanned, but Python objects are only
+    built for the selected members values. Documents not holding a
+    mapping are constructed as a whole.
+
+    :param  fd: file object opened on the file to parse, or its content
+    :type   fd: file
+
+    :param  Loader: yaml loader class
+    :type   Loader: type
+
+    :param  keep: predicate selecting top-level members by key
+    :type   keep: callable
+    """
+    from yaml.nodes import MappingNode
+
+    loader = Loader(fd)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None
+
+        if not isinstance(node, MappingNode):
+            return loader.construct_document(node)
+
+        # Resolve merge keys ("<<") first, as construct_mapping would
+        loader.flatten_mapping(node)
+
+        document = {}
+        for key_node, value_node in node.value:
+            key = loader.construct_object(key_node, deep=True)
+            if keep(key):
+                document[key] = loader.construct_object(value_node, deep=True)
+
+        return document
+    finally:
+        loader.dispose()
+
+
+# Compiled Python settings files, as {realpath: (mtime, digest, code)}
+_python_code_cache = {}
+
+
+def python_settings_load(path, source=None, mtime=None):
+    """Executes a Python settings file, and returns its globals
+
+    The file is executed in a fresh module namespace, which is never
+    registered in sys.modules. Its compiled code is cached, keyed by the
+    file mtime and source digest, and reused as long as they don't change.
+
+    :param  path: path of the file to execute
+    :type   path: str
+
+    :param  source: file content, read from path when not provided
+    :type   source: bytes
+
+    :param  mtime: file mtime in nanoseconds, along with source
+    :type   mtime: int
+    """
+    import hashlib
+    import importlib.util
+    import importlib.machinery
+
+    if source is None:
+        with open(path, 'rb') as fd:
+            mtime = os.fstat(fd.fileno()).st_mtime_ns
+            source = fd.read()
+
+    realpath = os.path.realpath(path)
+    digest = hashlib.sha256(source).digest()
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    loader = importlib.machinery.SourceFileLoader(module_name, path)
+
+    cached = _python_code_cache.get(realpath)
+    if cached is not None and cached[:2] == (mtime, digest):
+        code = cached[2]
+    else:
+        code = loader.source_to_code(source, path)
+        _python_code_cache[realpath] = (mtime, digest, code)
+
+    spec = importlib.util.spec_from_file_location(module_name, path, loader=loader)
+    module = importlib.util.module_from_spec(spec)
+    exec(code, vars(module))
+
+    return vars(module)
@@ -0,0 +1,311 @@
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+
+# Hash bits consumed by each level of the trie
+BITS = 5
+MASK = (1 << BITS) - 1
+HASH_MASK = (1 << 64) - 1
+
+_missing = object()
+
+
+def _hash(key):
+    return hash(key) & HASH_MASK
+
+
+def _popcount(value):
+    return bin(value).count('1')
+
+
+def _same_key(leaf, key_hash, key):
+    return leaf[0] == key_hash and (leaf[1] is key or leaf[1] == key)
+
+
+def _merge_leaves(shift, leaf, other):
+    """Returns a node holding two leaves with different keys"""
+    if leaf[0] == other[0]:
+        return _CollisionNode(leaf[0], (leaf, other))
+
+    bit = 1 << ((leaf[0] >> shift) & MASK)
+    other_bit = 1 << ((other[0] >> shift) & MASK)
+    if bit == other_bit:
+        return _BitmapNode(bit, (_merge_leaves(shift + BITS, leaf, other),))
+
+    entries = (leaf, other) if bit < other_bit else (other, leaf)
+    return _BitmapNode(bit | other_bit, entries)
+
+
+class _BitmapNode(object):
+    """Trie node holding up to 32 entries, leaves or child nodes
+
+    Leaves are (hash, key, value) tuples. The bitmap tells which of the
+    32 possible hash slices at this level the entries stand for.
+    """
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def get(self, shift, key_hash, key, default):
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            return default
+
+        entry = self.entries[_popcount(self.bitmap & (bit - 1))]
+        if type(entry) is tuple:
+            return entry[2] if _same_key(entry, key_hash, key) else default
+
+        return entry.get(shift + BITS, key_hash, key, default)
+
+    def set(self, shift, key_hash, key, value):
+        """Returns a node holding value under key, and whether key was added"""
+        bit = 1 << ((key_hash >> shift) & MASK)
+        position = _popcount(self.bitmap & (bit - 1))
+        leaf = (key_hash, key, value)
+
+        if not self.bitmap & bit:
+            entries = self.entries[:position] + (leaf,) + self.entries[position:]
+            return _BitmapNode(self.bitmap | bit, entries), True
+
+        entry = self.entries[position]
+        if type(entry) is tuple:
+            if _same_key(entry, key_hash, key):
+                if entry[2] is value:
+                    return self, False
+                new_entry, added = leaf, False
+            else:
+                new_entry, added = _merge_leaves(shift + BITS, entry, leaf), True
+        else:
+            new_entry, added = entry.set(shift + BITS, key_hash, key, value)
+            if new_entry is entry:
+                return self, False
+
+        entries = self.entries[:position] + (new_entry,) + self.entries[position + 1:]
+        return _BitmapNode(self.bitmap, entries), added
+
+    def delete(self, shift, key_hash, key):
+        """Returns the node left once key is deleted
+
+        Nodes left with a single leaf collapse into it, and empty
+        nodes into None.
+
+        :raises: KeyError if the node doesn't hold key
+        """
+        bit = 1 << ((key_hash >> shift) & MASK)
+        if not self.bitmap & bit:
+            raise KeyError(key)
+
+        position = _popcount(self.bitmap & (bit - 1))
+        entry = self.entries[position]
+        if type(entry) is tuple:
+            if not _same_key(entry, key_hash, key):
+                raise KeyError(key)
+            new_entry = None
+        else:
+            new_entry = entry.delete(shift + BITS, key_hash, key)
+
+        if new_entry is None:
+            entries = self.entries[:position] + self.entries[position + 1:]
+            bitmap = self.bitmap & ~bit
+        else:
+            entries = self.entries[:position] + (new_entry,) + self.entries[position + 1:]
+            bitmap = self.bitmap
+
+        if not entries:
+            return None
+        if shift and len(entries) == 1 and type(entries[0]) is tuple:
+            return entries[0]
+        return _BitmapNode(bitmap, entries)
+
+    def leaves(self):
+        for entry in self.entries:
+            if type(entry) is tuple:
+                yield entry
+            else:
+                for leaf in entry.leaves():
+                    yield leaf
+
+
+class _CollisionNode(object):
+    """Trie node holding the leaves of keys whose hashes are equal"""
+    __slots__ = ('key_hash', 'entries')
+
+    def __init__(self, key_hash, entries):
+        self.key_hash = key_hash
+        self.entries = entries
+
+    def get(self, shift, key_hash, key, default):
+        for leaf in self.entries:
+            if _same_key(leaf, key_hash, key):
+                return leaf[2]
+        return default
+
+    def set(self, shift, key_hash, key, value):
+        if key_hash != self.key_hash:
+            # Nest the collisions one level down, next to the new key
+            node = _BitmapNode(1 << ((self.key_hash >> shift) & MASK), (self,))
+            return node.set(shift, key_hash, key, value)
+
+        for position, leaf in enumerate(self.entries):
+            if _same_key(leaf, key_hash, key):
+                if leaf[2] is value:
+                    return self, False
+                entries = self.entries[:position] + ((key_hash, key, value),) + self.entries[position + 1:]
+                return _CollisionNode(key_hash, entries), False
+
+        return _CollisionNode(key_hash, self.entries + ((key_hash, key, value),)), True
+
+    def delete(self, shift, key_hash, key):
+        for position, leaf in enumerate(self.entries):
+            if _same_key(leaf, key_hash, key):
+                entries = self.entries[:position] + self.entries[position + 1:]
+                if len(entries) == 1:
+                    return entries[0]
+                return _CollisionNode(key_hash, entries)
+
+        raise KeyError(key)
+
+    def leaves(self):
+        return iter(self.entries)
+
+
+_EMPTY_ROOT = _BitmapNode(0, ())
+
+
+class PersistentMap(Mapping):
+    """Immutable mapping implemented as a hash array mapped trie
+
+    Modifying methods return a new map, and leave the original one
+    untouched. Both share every trie node but the ones on the path
+    to the modified key: setting or deleting a key costs O(log n),
+    in time and memory, whatever the map size.
+
+    Its API mirrors the immutables package Map, which the Map name
+    of this module refers to when installed.
+    """
+    __slots__ = ('_root', '_count')
+
+    def __init__(self, *args, **kwargs):
+        self._root = _EMPTY_ROOT
+        self._count = 0
+
+        if args or kwargs:
+            built = self.update(*args, **kwargs)
+            self._root, self._count = built._root, built._count
+
+    @classmethod
+    def _from_root(cls, root, count):
+        persistent_map = cls.__new__(cls)
+        persistent_map._root = root
+        persistent_map._count = count
+        return persistent_map
+
+    def __getitem__(self, key):
+        value = self._root.get(0, _hash(key), key, _missing)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        return self._root.get(0, _hash(key), key, default)
+
+    def __contains__(self, key):
+        return self._root.get(0, _hash(key), key, _missing) is not _missing
+
+    def __iter__(self):
+        for leaf in self._root.leaves():
+            yield leaf[1]
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        items = dict((leaf[1], leaf[2]) for leaf in self._root.leaves())
+        return '{0}({1!r})'.format(self.__class__.__name__, items)
+
+    def set(self, key, value):
+        """Returns a new map holding value under key"""
+        root, added = self._root.set(0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return self._from_root(root, self._count + added)
+
+    def delete(self, key):
+        """Returns a new map without key
+
+        :raises: KeyError if the map doesn't hold key
+        """
+        root = self._root.delete(0, _hash(key), key)
+        return self._from_root(root or _EMPTY_ROOT, self._count - 1)
+
+    def update(self, *args, **kwargs):
+        """Returns a new map updated with a mapping or pairs, and keyword arguments"""
+        pairs = []
+        for arg in args:
+            pairs.extend(arg.items() if isinstance(arg, Mapping) else arg)
+        pairs.extend(kwargs.items())
+
+        root, count = self._root, self._count
+        for key, value in pairs:
+            root, added = root.set(0, _hash(key), key, value)
+            count += added
+
+        return self._from_root(root, count)
+
+
+class _ImmutablesMap(Mapping):
+    """immutables.Map wrapper, equal to any mapping holding the same items
+
+    immutables.Map instances only compare equal to one another, while
+    snapshots are compared to dicts, as any other Mapping.
+    """
+    __slots__ = ('_map',)
+
+    def __init__(self, *args, **kwargs):
+        self._map = immutables.Map(*args, **kwargs)
+
+    @classmethod
+    def _wrap(cls, wrapped):
+        immutables_map = cls.__new__(cls)
+        immutables_map._map = wrapped
+        return immutables_map
+
+    def __getitem__(self, key):
+        return self._map[key]
+
+    def get(self, key, default=None):
+        return self._map.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __iter__(self):
+        return iter(self._map)
+
+    def __len__(self):
+        return len(self._map)
+
+    def __repr__(self):
+        return 'Map({0!r})'.format(dict(self._map.items()))
+
+    def set(self, key, value):
+        return self._wrap(self._map.set(key, value))
+
+    def delete(self, key):
+        return self._wrap(self._map.delete(key))
+
+    def update(self, *args, **kwargs):
+        return self._wrap(self._map.update(*args, **kwargs))
+
+
+# The C implementation from the persistent extra is used when installed
+try:
+    import immutables
+except ImportError:
+    Map = PersistentMap
+else:
+    Map = _ImmutablesMap
@@ -0,0 +1,256 @@
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from etcaetera.utils import is_nested_key, deep_merge
+from etcaetera.formatters import cached_format
+from etcaetera.exceptions import ValidationError
+
+
+_missing = object()
+
+TRUE_STRINGS = frozenset(['1', 'true', 'yes', 'on'])
+FALSE_STRINGS = frozenset(['0', 'false', 'no', 'off', ''])
+
+
+def to_bool(value):
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in TRUE_STRINGS:
+            return True
+        if lowered in FALSE_STRINGS:
+            return False
+    elif value in (0, 1):
+        return bool(value)
+
+    raise ValueError("{0!r} is not a boolean".format(value))
+
+
+def to_list(value):
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',')] if value.strip() else []
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+
+    raise ValueError("{0!r} is not a list".format(value))
+
+
+# Coercion functions of the types which can't be built from strings as is
+COERCERS = {
+    bool: to_bool,
+    list: to_list,
+}
+
+
+class Field(object):
+    """Schema field, describing the value of a config key
+
+    :param  type: type values are coerced to, such as int, float, bool,
+                  or list, from comma separated strings
+    :type   type: type
+
+    :param  default: value of the key when no adapter provides it, fields
+                     without a default are required
+    :type   default: object
+
+    :param  choices: values the key is restricted to
+    :type   choices: list
+
+    :param  minimum: lowest value allowed
+    :type   minimum: object
+
+    :param  maximum: highest value allowed
+    :type   maximum: object
+
+    :param  coerce: function coercing values to type, defaults to type itself
+    :type   coerce: callable
+
+    Values of another type are only coerced from strings, ints being
+    widened to floats too: any other value is invalid, rather than
+    converted lossily. Custom coerce functions are given any value.
+    """
+    def __init__(self, type=str, default=_missing, choices=None, minimum=None,
+                 maximum=None, coerce=None):
+        self.type = type
+        self.default = default
+        self.choices = frozenset(choices) if choices is not None else None
+        self.minimum = minimum
+        self.maximum = maximum
+        self.coerce = coerce or COERCERS.get(type, type)
+        self.coerce_any = coerce is not None
+
+    @property
+    def required(self):
+        return self.default is _missing
+
+    def __repr__(self):
+        return '<Field {0}>'.format(', '.join('{0}={1!r}'.format(name, value) for name, value in (
+            ('type', '{0}.{1}'.format(self.type.__module__, self.type.__qualname__)),
+            ('default', None if self.required else self.default),
+            ('required', self.required),
+            ('choices', sorted(self.choices, key=repr) if self.choices is not None else None),
+            ('minimum', self.minimum),
+            ('maximum', self.maximum),
+        )))
+
+
+def get_path(data, path):
+    """Returns the value at a nested keys path, or _missing"""
+    value = data
+    for key in path:
+        if not isinstance(value, Mapping) or key not in value:
+            return _missing
+        value = value[key]
+    return value
+
+
+def set_path(tree, path, value):
+    for key in path[:-1]:
+        tree = tree.setdefault(key, {})
+    tree[path[-1]] = value
+
+
+def merge_sections(overlay, data, sections):
+    """Merges nested sections values over data ones, into the overlay
+
+    :raises: ValidationError if data hold something else than a section
+    """
+    for key, section in sections.items():
+        base = overlay.get(key, data.get(key, _missing))
+        if base is _missing:
+            base = {}
+        elif not isinstance(base, Mapping):
+            raise ValidationError("Invalid value {0!r} for {1}: not a mapping".format(base, key))
+        overlay[key] = deep_merge(base, section)
+
+
+class Schema(object):
+    """Typed description of a config keys
+
+    Schemas are compiled, once per formatter, into a validation function
+    generated for their fields, so that validating a config doesn't
+    interpret the fields definitions again.
+
+    :param  fields: fields, by top-level or dotted key
+    :type   fields: dict
+    """
+    def __init__(self, fields):
+        for key in fields:
+            is_nested_key(key)
+        self.fields = dict(fields)
+        self._compiled = {}
+
+    def __repr__(self):
+        return '<Schema {0!r}>'.format(sorted(self.fields.items()))
+
+    # Generated validation functions can't be pickled, and are compiled again
+    def __getstate__(self):
+        return {'fields': self.fields, '_compiled': {}}
+
+    def validate(self, data, formatter=None):
+        """Validates data, and returns the typed values of the schema keys
+
+        Returned values are the coerced values, and the defaults of the
+        missing keys, by top-level key. Nested sections holding them are
+        copied along the schema keys paths only. Data are not modified.
+
+        :raises: ValidationError if a key is missing or has an invalid value
+        """
+        validator = self._compiled.get(formatter)
+        if validator is None:
+            validator = self._compiled[formatter] = self.compile(formatter)
+        return validator(data)
+
+    def compile(self, formatter=None):
+        """Generates the validation function of the schema fields
+
+        Top-level keys are formatted using formatter, if provided.
+        """
+        namespace = {
+            '_missing': _missing,
+            'ValidationError': ValidationError,
+            'get_path': get_path,
+            'set_path': set_path,
+            'merge_sections': merge_sections,
+            'INVALID': "Invalid value {0!r} for {1}: {2}",
+        }
+        lines = [
+            'def validate(data):',
+            '    overlay = {}',
+            '    sections = {}',
+        ]
+
+        for index, (key, field) in enumerate(sorted(self.fields.items())):
+            path = key.split('.')
+            if formatter is not None:
+                path[0] = cached_format(formatter, path[0])
+            name = '.'.join(path)
+
+            namespace.update({
+                'path_{0}'.format(index): tuple(path),
+                'key_{0}'.format(index): path[0],
+                'type_{0}'.format(index): field.type,
+                'coerce_{0}'.format(index): field.coerce,
+                'default_{0}'.format(index): field.default,
+                'minimum_{0}'.format(index): field.minimum,
+                'maximum_{0}'.format(index): field.maximum,
+                'choices_{0}'.format(index): field.choices,
+                'name_{0}'.format(index): name,
+            })
+
+            nested = len(path) > 1
+            if nested:
+                lines.append('    value = get_path(data, path_{0})'.format(index))
+                store = '    {0}set_path(sections, path_{1}, {2})'
+            else:
+                lines.append('    value = data.get(key_{0}, _missing)'.format(index))
+                store = '    {0}overlay[key_{1}] = {2}'
+
+            lines.append('    if value is _missing:')
+            if field.required:
+                lines.append("        raise ValidationError('Missing required key {{0}}'.format(name_{0}))".format(index))
+            else:
+                lines.append(store.format('    ', index, 'default_{0}'.format(index)))
+            lines.append('    else:')
+
+            lines.append('        if value.__class__ is not type_{0}:'.format(index))
+            indent = '            '
+            if not field.coerce_any:
+                lines.append('            if isinstance(value, str){0}:'.format(
+                    ' or value.__class__ is int' if field.type is float else ''))
+                indent += '    '
+            lines.append(indent + 'try:')
+            lines.append(indent + '    value = coerce_{0}(value)'.format(index))
+            lines.append(indent + 'except (TypeError, ValueError) as error:')
+            lines.append(indent + '    raise ValidationError(INVALID.format(value, name_{0}, error)) from error'.format(index))
+            if not field.coerce_any:
+                # Instances of subclasses are kept, but for bools standing for ints
+                lines.append('            elif not isinstance(value, type_{0}){1}:'.format(
+                    index, ' or value.__class__ is bool' if field.type is int else ''))
+                lines.append("                raise ValidationError(INVALID.format(value, name_{0}, 'not of type {1}'))".format(
+                    index, field.type.__name__))
+
+            checks = [
+                ('minimum', 'value < minimum_{0}', "'lower than {{0!r}}'.format(minimum_{0})"),
+                ('maximum', 'value > maximum_{0}', "'greater than {{0!r}}'.format(maximum_{0})"),
+                ('choices', 'value not in choices_{0}', "'not one of the allowed choices'"),
+            ]
+            for attribute, condition, reason in checks:
+                if getattr(field, attribute) is not None:
+                    lines.append('        if {0}:'.format(condition.format(index)))
+                    lines.append('            raise ValidationError(INVALID.format(value, name_{0}, {1}))'.format(
+                        index, reason.format(index)))
+
+            lines.append(store.format('    ', index, 'value'))
+
+        lines.append('    if sections:')
+        lines.append('        merge_sections(overlay, data, sections)')
+        lines.append('    return overlay')
+
+        source = '\n'.join(lines) + '\n'
+        exec(compile(source, '<etcaetera schema>', 'exec'), namespace)
+
+        validator = namespace['validate']
+        validator.source = source
+        return validator
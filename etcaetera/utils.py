@@ -1,9 +1,17 @@
-from etcaetera.formatters import environ
+from functools import lru_cache
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from etcaetera.formatters import environ, cached_format
+from etcaetera.constants import KEY_PATH_CACHE_SIZE
 from etcaetera.exceptions import MalformationError
 
 
 def format_key(key):
-    return environ(key)
+    return cached_format(environ, key)
 
 
 def is_nested_key(key):
@@ -13,3 +21,96 @@ def is_nested_key(key):
         raise MalformationError 
 
     return '.' in key
+
+
+@lru_cache(maxsize=KEY_PATH_CACHE_SIZE)
+def split_key(key):
+    """Returns the path of a top-level or dotted key, as a tuple of keys
+
+    Paths are remembered, so that looking up the same dotted key again
+    doesn't split it again.
+
+    :raises: MalformationError if key is not a valid dotted key
+    """
+    return tuple(key.split('.')) if is_nested_key(key) else (key,)
+
+
+def deep_merge(base, other):
+    """Returns a mapping of base values, deep merged with other values
+
+    Other values take precedence, except that nested mappings both
+    hold under the same key are merged in turn. Neither mapping is
+    modified: only the nested mappings both hold are copied, every
+    other value, nested mappings included, is shared by reference.
+    """
+    merged = dict(base)
+    deep_update(merged, other)
+    return merged
+
+
+def deep_update(data, other):
+    """Deep merges other values into the data dict, see deep_merge
+
+    Only data itself is modified: its nested mappings are replaced by
+    merged copies rather than updated.
+    """
+    for key, value in other.items():
+        if isinstance(value, Mapping) and isinstance(data.get(key), Mapping):
+            data[key] = deep_merge(data[key], value)
+        else:
+            data[key] = value
+
+
+def copy_nested(value):
+    """Returns a copy of value, nested dicts and lists included
+
+    Only containers are copied, every other value is shared.
+    """
+    if type(value) is dict:
+        return dict((key, copy_nested(item)) for key, item in value.items())
+    if type(value) is list:
+        return [copy_nested(item) for item in value]
+    return value
+
+
+def compile_projection(keys, formatter=None):
+    """Compiles top-level or dotted keys into a projection tree
+
+    The projection tree maps keys to the projection tree of their value,
+    or to None when their whole value is to be kept. Top-level keys are
+    formatted using formatter, if provided.
+    """
+    tree = {}
+
+    for key in keys:
+        subkeys = key.split('.') if is_nested_key(key) else [key]
+        if formatter is not None:
+            subkeys[0] = cached_format(formatter, subkeys[0])
+
+        node = tree
+        for subkey in subkeys[:-1]:
+            if subkey in node and node[subkey] is None:
+                # Whole value is already kept
+                break
+            node = node.setdefault(subkey, {})
+        else:
+            node[subkeys[-1]] = None
+
+    return tree
+
+
+def project(data, tree):
+    """Returns the part of the data mapping selected by a projection tree"""
+    projected = {}
+
+    for key, subtree in tree.items():
+        if key not in data:
+            continue
+
+        value = data[key]
+        if subtree is None:
+            projected[key] = value
+        elif isinstance(value, Mapping):
+            projected[key] = project(value, subtree)
+
+    return projected
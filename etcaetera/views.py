@@ -0,0 +1,177 @@
+from collections import ChainMap
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from etcaetera.utils import deep_merge
+
+
+_missing = object()
+
+
+def merge_values(values):
+    """Merges a key values, sorted by decreasing precedence
+
+    Mappings are deep merged down to the first value which isn't
+    one: it, and any lower precedence value, is shadowed.
+    """
+    merged = values[0]
+    for value in values[1:]:
+        if not isinstance(merged, Mapping) or not isinstance(value, Mapping):
+            break
+        merged = deep_merge(value, merged)
+
+    return merged
+
+
+class DeepChainMap(ChainMap):
+    """ChainMap deep merging the nested mappings its maps hold under a key
+
+    Merged values are computed once, on first lookup: maps are expected
+    not to change, but through the chain writes, which go to the first one.
+    """
+    def __init__(self, *maps):
+        super(DeepChainMap, self).__init__(*maps)
+        self.merged = {}
+
+    def __getitem__(self, key):
+        merged = self.merged.get(key, _missing)
+        if merged is not _missing:
+            return merged
+
+        values = [mapping[key] for mapping in self.maps if key in mapping]
+        if not values:
+            return self.__missing__(key)
+
+        merged = self.merged[key] = merge_values(values)
+        return merged
+
+    def get(self, key, default=None):
+        merged = self.merged.get(key, _missing)
+        if merged is not _missing:
+            return merged
+
+        return self[key] if key in self else default
+
+    def __setitem__(self, key, value):
+        self.merged.pop(key, None)
+        super(DeepChainMap, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.merged.pop(key, None)
+        super(DeepChainMap, self).__delitem__(key)
+
+    def pop(self, key, *args):
+        self.merged.pop(key, None)
+        return super(DeepChainMap, self).pop(key, *args)
+
+    def popitem(self):
+        key, value = super(DeepChainMap, self).popitem()
+        self.merged.pop(key, None)
+        return key, value
+
+    def clear(self):
+        self.merged.clear()
+        super(DeepChainMap, self).clear()
+
+
+class LazyView(Mapping):
+    """Read-only view over a Config adapters, loading them on demand
+
+    Key lookups load adapters from the highest precedence one down to
+    the lowest one, and stop as soon as the key is found. Once every
+    adapter is loaded, or whenever the whole mapping is needed, their
+    data are published to the config, which stops using the view.
+
+    :param  config: config the view loads adapters for
+    :type   config: etcaetera.config.Config
+
+    :param  adapters: adapters to load, in increasing precedence order
+    :type   adapters: list
+
+    :param  previous: config data previously loaded, kept as eager
+                      loading would, unless the config is layered
+    :type   previous: dict
+    """
+    def __init__(self, config, adapters, previous=None):
+        self.config = config
+        self.adapters = adapters
+        self.layers = [None] * len(adapters)
+        self.previous = {} if previous is None or config.layered else previous
+
+    def __getitem__(self, key):
+        value = self.lookup(key)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.lookup(key) is not _missing
+
+    def get(self, key, default=None):
+        value = self.lookup(key)
+        return default if value is _missing else value
+
+    def __iter__(self):
+        self.materialize()
+        return iter(self.config)
+
+    def __len__(self):
+        self.materialize()
+        return len(self.config)
+
+    def lookup(self, key):
+        """Loads adapters by decreasing precedence until key is found
+
+        :returns: key value, or _missing if no adapter provides it
+        """
+        with self.config._lock:
+            values = []
+            for index in range(len(self.adapters) - 1, -1, -1):
+                if self.layers[index] is None:
+                    self.layers[index] = self.config._load_adapter(self.adapters[index])
+
+                if key in self.layers[index]:
+                    values.append(self.layers[index][key])
+                    # Deep merged mappings need the lower layers values too
+                    if not (self.config.deep_merge and isinstance(values[-1], Mapping)):
+                        break
+            else:
+                # Previously loaded values of the keys no adapter provides
+                # are kept, as with eager loading
+                if not values and key in self.previous:
+                    values.append(self.previous[key])
+
+            if all(layer is not None for layer in self.layers):
+                # Keys set on the config meanwhile are published along
+                view = self.materialize()
+                if view is None:
+                    return dict.get(self.config, key, _missing)
+                return view.get(key, _missing)
+
+            return merge_values(values) if values else _missing
+
+    def materialize(self):
+        """Loads the adapters left, and publishes all their data to the config
+
+        :returns: the view the config exposes its data through from now on,
+                  or None if the config stores them itself
+        """
+        with self.config._lock:
+            if self.config._view is self:
+                pending = [index for index, layer in enumerate(self.layers) if layer is None]
+                loaded = self.config._load_adapters([self.adapters[index] for index in pending])
+                for index, layer in zip(pending, loaded):
+                    self.layers[index] = layer
+
+                # Keys set on the config meanwhile win over adapters data,
+                # as they would have been set after an eager load
+                written = dict(dict.items(self.config))
+                dict.clear(self.config)
+                dict.update(self.config, self.previous)
+                self.config._publish(self.layers)
+                self.config.update(written)
+
+            return self.config._view
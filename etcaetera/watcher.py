@@ -0,0 +1,279 @@
+import os
+import sys
+import time
+import errno
+import select
+import logging
+import threading
+
+from etcaetera.adapter.file import File
+
+
+logger = logging.getLogger(__name__)
+
+
+# inotify(7) flags, see /usr/include/linux/inotify.h
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+# Watching containing directories rather than the files themselves
+# catches editors and deployment tools replacing files through an atomic
+# rename, as well as symlink swaps such as Kubernetes ConfigMaps
+# "..data" directory.
+IN_WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM |
+                 IN_MOVED_TO | IN_CREATE | IN_DELETE)
+
+
+def stat_fingerprint(path):
+    """Returns the (mtime, size, inode) of path, following symlinks"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class PollingBackend(object):
+    """Portable backend periodically stat-ing the watched paths
+
+    :param  paths: files paths to watch
+    :type   paths: list
+
+    :param  interval: seconds to wait between two paths stats
+    :type   interval: float
+    """
+    def __init__(self, paths, interval=1.0):
+        self.paths = list(paths)
+        self.interval = interval
+        self._stats = self._stat_all()
+
+    def _stat_all(self):
+        return [stat_fingerprint(path) for path in self.paths]
+
+    def wait(self, timeout=None):
+        """Blocks until a watched path changes, or timeout expires
+
+        :returns: whether a change was detected
+        """
+        deadline = None if timeout is None else time.time() + timeout
+
+        while True:
+            stats = self._stat_all()
+            if stats != self._stats:
+                self._stats = stats
+                return True
+
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class InotifyBackend(object):
+    """Linux backend relying on inotify(7) events
+
+    The directories containing the watched paths, and the directories
+    containing their symlinks targets, are watched.
+
+    :param  paths: files paths to watch
+    :type   paths: list
+    """
+    def __init__(self, paths):
+        import ctypes
+        import ctypes.util
+
+        self.paths = list(paths)
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError(errno.ENOSYS, "inotify is not supported on this system")
+
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        self._watched = set()
+        self.refresh()
+
+    def _directories(self):
+        directories = set()
+        for path in self.paths:
+            directories.add(os.path.dirname(os.path.abspath(path)))
+            directories.add(os.path.dirname(os.path.realpath(path)))
+        return directories
+
+    def refresh(self):
+        """Watches directories the watched paths currently resolve to"""
+        for directory in self._directories() - self._watched:
+            wd = self._libc.inotify_add_watch(self._fd, directory.encode(sys.getfilesystemencoding()),
+                                              IN_WATCH_MASK)
+            if wd >= 0:
+                self._watched.add(directory)
+
+    def wait(self, timeout=None):
+        """Blocks until an event occurs in a watched directory, or timeout expires
+
+        :returns: whether an event was received
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+
+        # Drain pending events: the watcher compares fingerprints
+        # to find out whether the files actually changed.
+        while True:
+            try:
+                if not os.read(self._fd, 65536):
+                    break
+            except (BlockingIOError, InterruptedError):
+                break
+
+        return True
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def default_backend(paths, interval=1.0):
+    """Returns an inotify backend on Linux, a polling backend otherwise"""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyBackend(paths)
+        except OSError:
+            pass
+
+    return PollingBackend(paths, interval=interval)
+
+
+class Watcher(object):
+    """Watches a Config File adapters sources, and reloads it on change
+
+    Changes are detected by a background thread, which waits for bursts
+    of changes to settle down for debounce seconds, and then reloads the
+    config. As the config only loads again the adapters whose fingerprint
+    changed, reloads are incremental.
+
+    :param  config: config to watch, along with its subconfigs
+    :type   config: etcaetera.config.Config
+
+    :param  interval: seconds between two checks of the stop flag, and
+                      between two stats of the polling backend
+    :type   interval: float
+
+    :param  debounce: seconds without any change to wait for before reloading
+    :type   debounce: float
+
+    :param  backend: 'inotify', 'polling' or None to pick the best available one
+    :type   backend: str
+
+    :param  callback: callable invoked with the config after each reload
+    :type   callback: callable
+    """
+    def __init__(self, config, interval=1.0, debounce=0.1, backend=None, callback=None):
+        self.config = config
+        self.interval = interval
+        self.debounce = debounce
+        self.callback = callback
+
+        self.adapters = list(self._file_adapters(config))
+        self.paths = [adapter.filepath for adapter in self.adapters]
+        self._fingerprints = [adapter.fingerprint() for adapter in self.adapters]
+
+        if backend == 'inotify':
+            self.backend = InotifyBackend(self.paths)
+        elif backend == 'polling':
+            self.backend = PollingBackend(self.paths, interval=interval)
+        elif backend is None:
+            self.backend = default_backend(self.paths, interval=interval)
+        else:
+            raise ValueError("Unknown watcher backend {0}".format(backend))
+
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _file_adapters(self, config):
+        for adapter in config.adapters:
+            if isinstance(adapter, File):
+                yield adapter
+
+        for subconfig in config._subconfigs.values():
+            for adapter in self._file_adapters(subconfig):
+                yield adapter
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='etcaetera-watcher')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.backend.close()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if not self.backend.wait(timeout=self.interval):
+                continue
+
+            # Let bursts of writes settle down before reloading
+            while not self._stopped.is_set() and self.backend.wait(timeout=self.debounce):
+                pass
+
+            if self._stopped.is_set():
+                break
+
+            self.backend.refresh()
+            self.check()
+
+    def check(self):
+        """Reloads the config if any watched file fingerprint changed
+
+        :returns: whether the config was reloaded
+        """
+        fingerprints = [adapter.fingerprint() for adapter in self.adapters]
+        if fingerprints == self._fingerprints:
+            return False
+
+        self._fingerprints = fingerprints
+
+        try:
+            self.config.load()
+        except Exception:
+            logger.exception("Reloading config after a file change failed")
+            return False
+
+        if self.callback is not None:
+            try:
+                self.callback(self.config)
+            except Exception:
+                # The config was reloaded, and next changes still have to be
+                logger.exception("Config reload callback failed")
+
+        return True
@@ -48,6 +48,11 @@ setup(
     install_requires=[
         'PyYaml',
     ],
+    python_requires='>=3.7',
+    extras_require={
+        # C implementation of the persistent maps snapshots are built of
+        'persistent': ['immutables'],
+    },
     license="MIT",
     zip_safe=False,
     keywords='etcaetera',
@@ -56,11 +61,13 @@ setup(
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Natural Language :: English',
-        "Programming Language :: Python :: 2",
-        'Programming Language :: Python :: 2.6',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
     ],
     cmdclass={'test': PyTest},
 )
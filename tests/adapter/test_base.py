@@ -1,4 +1,7 @@
+import asyncio
+import threading
 import pytest
+from collections import defaultdict
 
 from etcaetera.adapter import Adapter
 from etcaetera.exceptions import MalformationError
@@ -46,6 +49,61 @@ class TestAdapter:
         with pytest.raises(MalformationError):
             adapter['..abc'] = 'easy as'
         
+    def test___getitem___with_prefix_key_returns_nested_mapping(self):
+        adapter = Adapter()
+        adapter['abc.123.do'] = 're'
+
+        assert adapter['abc.123'] == {'do': 're'}
+        assert adapter['abc.123.do'] == 're'
+
+    def test___setitem___replacing_nested_mapping_drops_its_old_keys(self):
+        adapter = Adapter()
+        adapter['abc'] = {'123': {'do': 're'}}
+        assert adapter['abc.123.do'] == 're'
+
+        adapter['abc.123'] = {'mi': 'fa'}
+
+        assert adapter['abc.123.mi'] == 'fa'
+        assert 'abc.123.do' not in adapter
+
+    def test___getitem___after_data_replacement_returns_new_values(self):
+        adapter = Adapter()
+        adapter['abc.123'] = 'easy as'
+        assert adapter['abc.123'] == 'easy as'
+
+        adapter.data = {'abc': {'123': 'do re mi'}}
+
+        assert adapter['abc.123'] == 'do re mi'
+
+    def test___getitem___with_missing_nested_key_raises_without_creating_nodes(self):
+        adapter = Adapter()
+        adapter['abc.123'] = 'easy as'
+
+        with pytest.raises(KeyError):
+            adapter['abc.456.do']
+        with pytest.raises(KeyError):
+            adapter['do.re.mi']
+
+        assert adapter.data == {'abc': {'123': 'easy as'}}
+
+    def test___getitem___on_defaultdict_data_does_not_create_nodes(self):
+        adapter = Adapter()
+        adapter.data = defaultdict(dict, {'abc': {'123': 'easy as'}})
+
+        with pytest.raises(KeyError):
+            adapter['do.re']
+
+        assert list(adapter.data) == ['abc']
+
+    def test_get_with_missing_key_returns_default(self):
+        adapter = Adapter()
+        adapter['abc.123'] = 'easy as'
+
+        assert adapter.get('abc.123') == 'easy as'
+        assert adapter.get('abc.456', 'default') == 'default'
+        assert 'abc.123' in adapter
+        assert 'abc.456' not in adapter
+
     def test_load_is_not_implemented(self):
         adapter = Adapter()
 
@@ -53,3 +111,14 @@ class TestAdapter:
             adapter.load()
 
 
+    def test_aload_runs_load_in_executor(self):
+        class SyncAdapter(Adapter):
+            def load(self, formatter=None):
+                self.thread = threading.current_thread()
+                self.data = {self.format("abc", formatter): "123"}
+
+        adapter = SyncAdapter()
+        asyncio.run(adapter.aload())
+
+        assert adapter.data == {"ABC": "123"}
+        assert adapter.thread is not threading.main_thread()
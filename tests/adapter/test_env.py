@@ -65,3 +65,86 @@ class TestEnv:
 
         del os.environ['SRC_ABC']
 
+
+    def test_fingerprint_changes_when_selected_env_vars_change(self):
+        env = Env("abc", **{"src_abc": "dest_abc"})
+        os.environ["ABC"] = "123"
+        fingerprint = env.fingerprint()
+
+        assert env.fingerprint() == fingerprint
+
+        os.environ["SRC_ABC"] = "456"
+        assert env.fingerprint() != fingerprint
+
+        del os.environ['ABC']
+        del os.environ['SRC_ABC']
+
+    def test_load_with_prefix_strips_it(self):
+        env = Env(prefix="etc_test_")
+        os.environ["ETC_TEST_ABC"] = "123"
+        os.environ["ETC_TESTING"] = "456"
+        env.load()
+
+        assert env.data == {"ABC": "123"}
+
+        del os.environ['ETC_TEST_ABC']
+        del os.environ['ETC_TESTING']
+
+    def test_load_with_prefix_without_stripping_it(self):
+        env = Env(prefix="etc_test_", strip_prefix=False)
+        os.environ["ETC_TEST_ABC"] = "123"
+        env.load()
+
+        assert env.data == {"ETC_TEST_ABC": "123"}
+
+        del os.environ['ETC_TEST_ABC']
+
+    def test_load_with_prefix_and_separator_nests_keys(self):
+        env = Env(prefix="etc_test", separator="__")
+        os.environ["ETC_TEST__DB__HOST"] = "localhost"
+        os.environ["ETC_TEST__DB__PORT"] = "5432"
+        os.environ["ETC_TEST__DEBUG"] = "1"
+        env.load()
+
+        assert env.data == {"DB": {"HOST": "localhost", "PORT": "5432"}, "DEBUG": "1"}
+        assert env["DB.HOST"] == "localhost"
+
+        del os.environ['ETC_TEST__DB__HOST']
+        del os.environ['ETC_TEST__DB__PORT']
+        del os.environ['ETC_TEST__DEBUG']
+
+    def test_fingerprint_with_prefix_changes_when_matching_env_vars_change(self):
+        env = Env(prefix="etc_test_")
+        fingerprint = env.fingerprint()
+
+        os.environ["ETC_TEST_ABC"] = "123"
+        assert env.fingerprint() != fingerprint
+
+        del os.environ['ETC_TEST_ABC']
+
+    def test_load_with_fingerprint_reuses_its_scan(self):
+        env = Env(prefix="etc_test_")
+        os.environ["ETC_TEST_ABC"] = "123"
+        scans = []
+        scan = env._scan
+        env._scan = lambda: scans.append(1) or scan()
+
+        env.load(fingerprint=env.fingerprint())
+
+        assert len(scans) == 1
+        assert env.data == {"ABC": "123"}
+
+        del os.environ['ETC_TEST_ABC']
+
+    def test_load_without_fingerprint_reads_current_environment(self):
+        env = Env(prefix="etc_test_")
+        os.environ["ETC_TEST_ABC"] = "123"
+        env.fingerprint()
+        os.environ["ETC_TEST_EASY"] = "as"
+
+        env.load()
+
+        assert env.data == {"ABC": "123", "EASY": "as"}
+
+        del os.environ['ETC_TEST_ABC']
+        del os.environ['ETC_TEST_EASY']
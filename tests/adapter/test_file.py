@@ -4,6 +4,7 @@ import yaml
 import pytest
 import tempfile
 
+from etcaetera import cache, parsers
 from etcaetera.adapter import File
 
 
@@ -121,3 +122,119 @@ class TestFile:
         fadapter.load()
 
         assert fadapter.data == {}
+
+    def test_fingerprint_changes_when_file_changes(self, json_file):
+        fadapter = File(json_file.name)
+        fingerprint = fadapter.fingerprint()
+
+        assert fingerprint is not None
+        assert fadapter.fingerprint() == fingerprint
+
+        with open(json_file.name, 'w') as f:
+            f.write(json.dumps({'abc': '123', 'easy': 'as'}))
+
+        assert fadapter.fingerprint() != fingerprint
+
+        with open(json_file.name, 'w') as f:
+            f.write(json.dumps({'abc': '123'}))
+
+    def test_fingerprint_with_non_existing_file_is_none(self):
+        fadapter = File('/tmp/does/not/exist')
+
+        assert fadapter.fingerprint() is None
+
+    def test_load_shares_parsed_file_between_adapters(self, yaml_file):
+        cache.documents.clear()
+
+        first, second = File(yaml_file.name), File(yaml_file.name)
+        first.load()
+        second.load()
+
+        assert first.data == second.data == {'ABC': '123'}
+        assert cache.documents.info().misses == 1
+        assert cache.documents.info().hits == 1
+
+    def test_load_streams_json_files_above_threshold(self, json_file, monkeypatch):
+        monkeypatch.setattr('etcaetera.adapter.file.JSON_STREAM_THRESHOLD', 0)
+        cache.documents.clear()
+
+        fadapter = File(json_file.name)
+        fadapter.load()
+
+        assert fadapter.data == {'ABC': '123'}
+
+    @pytest.mark.parametrize('suffix, dump', [
+        ('.json', json.dumps),
+        ('.yaml', yaml.dump),
+    ])
+    def test_load_with_projection_keeps_selected_keys_only(self, tmpdir, suffix, dump):
+        path = tmpdir.join('settings' + suffix)
+        path.write(dump({
+            'abc': {'123': 'do', '456': 're'},
+            'easy': 'as',
+            'skipped': {'mi': ['fa', {'sol': 'la'}]},
+        }))
+
+        fadapter = File(str(path), projection=['abc.123', 'EASY'])
+        fadapter.load()
+
+        assert fadapter.data == {'ABC': {'123': 'do'}, 'EASY': 'as'}
+
+    def test_load_with_projection_on_pysettings_file(self, pysettings_file):
+        fadapter = File(pysettings_file.name, projection=['ABC', 'EASY_AS'])
+        fadapter.load()
+
+        assert fadapter.data == {'ABC': 123, 'EASY_AS': ['do', 're', 'mi']}
+
+    def test_load_with_projection_does_not_share_cached_full_document(self, yaml_file):
+        File(yaml_file.name).load()
+
+        fadapter = File(yaml_file.name, projection=['easy'])
+        fadapter.load()
+
+        assert fadapter.data == {}
+
+    def test_load_with_pinned_json_backend(self, json_file, monkeypatch):
+        calls = []
+        monkeypatch.setitem(parsers._json_backends_loaders, 'ujson',
+                            lambda: lambda content: calls.append(content) or json.loads(content))
+        cache.documents.clear()
+
+        fadapter = File(json_file.name, json_backend='ujson')
+        fadapter.load()
+
+        assert fadapter.data == {'ABC': '123'}
+        assert len(calls) == 1
+
+    def test_load_measures_io_and_parse_times(self, json_file):
+        cache.documents.clear()
+        fadapter = File(json_file.name)
+        fadapter.load()
+
+        assert fadapter.bytes_read == os.path.getsize(json_file.name)
+        assert fadapter.io_time > 0
+        assert fadapter.parse_time > 0
+
+    def test_load_of_a_cached_document_reads_nothing(self, yaml_file):
+        File(yaml_file.name).load()
+        fadapter = File(yaml_file.name)
+        fadapter.load()
+
+        assert fadapter.bytes_read == 0
+        assert fadapter.parse_time == 0.0
+
+    def test_load_doesnt_share_modifiable_data_with_cached_documents(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"db": {"host": "localhost", "ports": [1, 2]}}))
+
+        first = File(str(settings_path))
+        first.load()
+        first['DB.host'] = 'modified'
+        first['DB']['ports'].append(3)
+
+        second = File(str(settings_path))
+        second.load()
+        first.load()
+
+        assert second['DB'] == {"host": "localhost", "ports": [1, 2]}
+        assert first['DB'] == {"host": "localhost", "ports": [1, 2]}
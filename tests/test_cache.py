@@ -0,0 +1,126 @@
+import os
+import sys
+
+from etcaetera.adapter import Defaults, Env, Module
+from etcaetera.formatters import uppercased, lowercased
+from etcaetera.cache import (
+    DocumentCache,
+    CompiledCache,
+    compiled_key,
+)
+
+
+class TestDocumentCache:
+    def test_get_with_missing_key_returns_none(self):
+        cache = DocumentCache()
+
+        assert cache.get(('/abc', 1, 2, 3)) is None
+        assert cache.info().misses == 1
+
+    def test_get_with_existing_key_returns_document(self):
+        cache = DocumentCache()
+        document = {"abc": "123"}
+        cache.set(('/abc', 1, 2, 3), document, 2)
+
+        assert cache.get(('/abc', 1, 2, 3)) == document
+        assert cache.info().hits == 1
+
+    def test_get_returns_copies_of_the_cached_document(self):
+        cache = DocumentCache()
+        document = {"abc": {"123": ["easy", "as"]}}
+        cache.set(('/abc', 1, 2, 3), document, 2)
+
+        document["abc"]["123"].append("do re mi")
+        copy = cache.get(('/abc', 1, 2, 3))
+        copy["abc"]["123"].append("simple as")
+
+        assert cache.get(('/abc', 1, 2, 3)) == {"abc": {"123": ["easy", "as"]}}
+
+    def test_get_returns_copies_of_documents_which_cant_be_marshalled(self):
+        cache = DocumentCache()
+        leaf = object()
+        document = {"abc": {"123": leaf}}
+        cache.set(('/abc', 1, 2, 3), document, 2)
+
+        copy = cache.get(('/abc', 1, 2, 3))
+
+        assert copy == document
+        assert copy["abc"] is not document["abc"]
+        assert copy["abc"]["123"] is leaf
+
+    def test_set_new_file_version_evicts_previous_one(self):
+        cache = DocumentCache()
+        cache.set(('/abc', 1, 2, 3), {"abc": "123"}, 2)
+        cache.set(('/abc', 4, 2, 3), {"abc": "456"}, 2)
+
+        assert len(cache) == 1
+        assert cache.get(('/abc', 1, 2, 3)) is None
+        assert cache.info().currbytes == 2
+
+    def test_set_evicts_least_recently_used_documents_above_maxsize(self):
+        cache = DocumentCache(maxsize=2)
+        cache.set(('/abc', 1, 1, 1), {}, 1)
+        cache.set(('/easy', 1, 1, 1), {}, 1)
+        cache.get(('/abc', 1, 1, 1))
+        cache.set(('/do', 1, 1, 1), {}, 1)
+
+        assert cache.get(('/abc', 1, 1, 1)) is not None
+        assert cache.get(('/easy', 1, 1, 1)) is None
+        assert cache.get(('/do', 1, 1, 1)) is not None
+
+    def test_set_evicts_documents_above_maxbytes(self):
+        cache = DocumentCache(maxbytes=10)
+        cache.set(('/abc', 1, 6, 1), {}, 6)
+        cache.set(('/easy', 1, 6, 1), {}, 6)
+
+        assert len(cache) == 1
+        assert cache.info().currbytes == 6
+
+    def test_set_ignores_documents_larger_than_maxbytes(self):
+        cache = DocumentCache(maxbytes=10)
+        cache.set(('/abc', 1, 11, 1), {}, 11)
+
+        assert len(cache) == 0
+
+
+class TestCompiledCache:
+    def test_load_with_missing_file_returns_none(self, tmpdir):
+        cache = CompiledCache(str(tmpdir.join('abc.cache')))
+
+        assert cache.load('123') is None
+
+    def test_load_with_corrupted_file_returns_none(self, tmpdir):
+        path = tmpdir.join('abc.cache')
+        path.write('easy as do re mi')
+        cache = CompiledCache(str(path))
+
+        assert cache.load('123') is None
+
+    def test_load_returns_dumped_data_for_matching_key_only(self, tmpdir):
+        cache = CompiledCache(str(tmpdir.join('abc.cache')))
+
+        assert cache.dump('123', {"ABC": "123"}) is True
+        assert cache.load('123') == {"ABC": "123"}
+        assert cache.load('456') is None
+
+
+class TestCompiledKey:
+    def test_changes_when_an_adapter_source_changes(self):
+        os.environ["ABC"] = "123"
+        adapters = [Defaults({"easy": "as"}), Env("abc")]
+        key = compiled_key(uppercased, adapters)
+
+        assert compiled_key(uppercased, adapters) == key
+
+        os.environ["ABC"] = "456"
+        assert compiled_key(uppercased, adapters) != key
+
+        del os.environ["ABC"]
+
+    def test_changes_with_formatter(self):
+        adapters = [Defaults({"easy": "as"})]
+
+        assert compiled_key(uppercased, adapters) != compiled_key(lowercased, adapters)
+
+    def test_is_none_when_an_adapter_cannot_be_cached(self):
+        assert compiled_key(uppercased, [Module(sys)]) is None
@@ -1,9 +1,18 @@
+import copy
+import pickle
 import pytest
 import tempfile
 import json
 import os
+import asyncio
+import time
+import threading
 
 from etcaetera.config import Config
+from etcaetera.schema import Field
+from etcaetera.interning import InternPool
+from etcaetera.persistent import Map
+from etcaetera.exceptions import ValidationError
 from etcaetera.adapter import (
     Adapter,
     Defaults,
@@ -242,3 +251,864 @@ class TestConfig:
         assert config["USER"] == os.environ["USER"]
         assert config["PATH"] == os.environ["PATH"]
 
+    def test_load_with_workers_loads_adapters_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        class BarrierAdapter(Adapter):
+            def __init__(self, value, *args, **kwargs):
+                super(BarrierAdapter, self).__init__(*args, **kwargs)
+                self.value = value
+
+            def load(self, formatter=None):
+                # Would time out, and break, if adapters were loaded sequentially
+                barrier.wait()
+                self.data = {self.format("abc", formatter): self.value}
+
+        config = Config(workers=3)
+        config.register(BarrierAdapter("1"), BarrierAdapter("2"), BarrierAdapter("3"))
+        config.load()
+
+        assert config["ABC"] == "3"
+
+    def test_load_with_workers_protects_adapters_precedence(self):
+        class SlowAdapter(Adapter):
+            def __init__(self, delay, value, *args, **kwargs):
+                super(SlowAdapter, self).__init__(*args, **kwargs)
+                self.delay = delay
+                self.value = value
+
+            def load(self, formatter=None):
+                time.sleep(self.delay)
+                self.data = {self.format("abc", formatter): self.value}
+
+        config = Config(Defaults({"abc": "defaults"}), Overrides({"easy": "as"}), workers=4)
+        config.register(SlowAdapter(0.1, "slow"), SlowAdapter(0, "fast"))
+        config.load()
+
+        assert config["ABC"] == "fast"
+        assert config["EASY"] == "as"
+
+    def test_load_cascades_workers_to_subconfigs(self):
+        main_config = Config(workers=2)
+        subconfig = Config({"abc": "123"})
+        main_config.add_subconfig('mysubconfig', subconfig)
+
+        main_config.load()
+
+        assert subconfig.workers == 2
+        assert subconfig["ABC"] == "123"
+
+    def test_aload_loads_values_from_adapters_and_subconfigs(self):
+        config = Config({"abc": "123"}, {"easy": "as"})
+        config.register(Defaults({"abc": "456"}))
+        subconfig = Config({"do": "re mi"})
+        config.add_subconfig('mysubconfig', subconfig)
+
+        asyncio.run(config.aload())
+
+        assert config["ABC"] == "456"
+        assert config["EASY"] == "as"
+        assert subconfig["DO"] == "re mi"
+
+    def test_aload_awaits_native_async_adapters_concurrently(self):
+        pending = set(["1", "2"])
+        state = {}
+
+        class AsyncAdapter(Adapter):
+            def __init__(self, value, *args, **kwargs):
+                super(AsyncAdapter, self).__init__(*args, **kwargs)
+                self.value = value
+
+            async def aload(self, formatter=None):
+                event = state.setdefault("event", asyncio.Event())
+                pending.discard(self.value)
+                if not pending:
+                    event.set()
+
+                # Would time out if adapters were awaited one after the other
+                await asyncio.wait_for(event.wait(), timeout=5)
+                self.data = {self.format("abc", formatter): self.value}
+
+        config = Config()
+        config.register(AsyncAdapter("1"), AsyncAdapter("2"))
+        asyncio.run(config.aload())
+
+        assert config["ABC"] == "2"
+
+    def test_aload_with_cache_path_skips_adapters_loading_on_hit(self, tmpdir):
+        class CountingAdapter(Adapter):
+            loads = 0
+
+            def persistent_fingerprint(self):
+                return "abc"
+
+            def load(self, formatter=None):
+                CountingAdapter.loads += 1
+                self.data = {self.format("abc", formatter): "123"}
+
+        cache_path = str(tmpdir.join('config.cache'))
+
+        config = Config(cache_path=cache_path)
+        config.register(CountingAdapter())
+        asyncio.run(config.aload())
+
+        cold_config = Config(cache_path=cache_path)
+        cold_config.register(CountingAdapter())
+        asyncio.run(cold_config.aload())
+
+        assert CountingAdapter.loads == 1
+        assert cold_config["ABC"] == "123"
+        assert cold_config.load_stats().cached is True
+
+    def test_aload_with_projection_keeps_selected_keys_only(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"abc": {"123": "do", "456": "re"}, "mi": "fa"}))
+
+        config = Config({"easy": "as", "sol": "la"}, projection=["abc.123", "easy"])
+        config.register(File(str(settings_path)))
+        asyncio.run(config.aload())
+
+        assert config == {"ABC": {"123": "do"}, "EASY": "as"}
+
+    def test_load_scans_environment_once_per_env_adapter(self):
+        env = Env(prefix="etc_test_")
+        scans = []
+        scan = env._scan
+        env._scan = lambda: scans.append(1) or scan()
+        config = Config()
+        config.register(env)
+
+        os.environ["ETC_TEST_ABC"] = "123"
+        config.load()
+        del os.environ["ETC_TEST_ABC"]
+
+        assert len(scans) == 1
+        assert config == {"ABC": "123"}
+
+    def test_load_skips_adapters_with_unchanged_fingerprint(self):
+        class CountingAdapter(Adapter):
+            def __init__(self, *args, **kwargs):
+                super(CountingAdapter, self).__init__(*args, **kwargs)
+                self.loads = 0
+                self.version = 1
+
+            def fingerprint(self):
+                return self.version
+
+            def load(self, formatter=None):
+                self.loads += 1
+                self.data = {self.format("abc", formatter): self.version}
+
+        adapter = CountingAdapter()
+        config = Config()
+        config.register(adapter)
+
+        config.load()
+        config.load()
+        assert adapter.loads == 1
+        assert config["ABC"] == 1
+
+        adapter.version = 2
+        config.load()
+        assert adapter.loads == 2
+        assert config["ABC"] == 2
+
+    def test_load_reparses_modified_file(self):
+        sample_json_file = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
+        sample_json_file.write(json.dumps({"abc": "123"}).encode('utf-8'))
+        sample_json_file.close()
+
+        config = Config()
+        config.register(File(sample_json_file.name))
+        config.load()
+        assert config["ABC"] == "123"
+
+        with open(sample_json_file.name, 'w') as f:
+            f.write(json.dumps({"abc": "456 789"}))
+
+        config.load()
+        assert config["ABC"] == "456 789"
+
+        os.remove(sample_json_file.name)
+
+    def test_lazy_load_only_loads_adapters_needed_to_resolve_key(self):
+        class CountingAdapter(Adapter):
+            def __init__(self, data, *args, **kwargs):
+                super(CountingAdapter, self).__init__(*args, **kwargs)
+                self.source = data
+                self.loads = 0
+
+            def load(self, formatter=None):
+                self.loads += 1
+                self.data = dict((self.format(k, formatter), v) for k, v in self.source.items())
+
+        lower = CountingAdapter({"abc": "lower", "easy": "as"})
+        upper = CountingAdapter({"abc": "upper"})
+        config = Config(lazy=True)
+        config.register(lower, upper)
+        config.load()
+
+        assert lower.loads == 0 and upper.loads == 0
+
+        assert config["ABC"] == "upper"
+        assert lower.loads == 0 and upper.loads == 1
+
+        assert "EASY" in config
+        assert config.get("EASY") == "as"
+        assert config.get("DO RE MI", "default") == "default"
+        assert lower.loads == 1 and upper.loads == 1
+
+    def test_lazy_load_protects_adapters_precedence(self):
+        config = Config({"abc": "defaults", "easy": "as"}, {"abc": "overrides"}, lazy=True)
+        config.register(Env("DO RE MI"))
+        config.load()
+
+        assert config["ABC"] == "overrides"
+        assert config["EASY"] == "as"
+        with pytest.raises(KeyError):
+            config["DO RE MI"]
+
+    def test_lazy_load_materializes_whole_config_on_iteration(self):
+        config = Config({"abc": "123"}, {"easy": "as"}, lazy=True)
+        config.load()
+
+        assert dict.__len__(config) == 0
+        assert sorted(config.keys()) == ["ABC", "EASY"]
+        assert config == {"ABC": "123", "EASY": "as"}
+        assert config._view is None
+
+    def test_lazy_load_reads_keys_set_on_the_config(self):
+        for layered in (False, True):
+            config = Config({"abc": "defaults"}, {"easy": "as"}, layered=layered, lazy=True)
+            config.register(Env())
+            config.load()
+
+            config["X"] = 10
+            config["EASY"] = "written"
+            assert config.get("X") == 10
+            assert "X" in config
+            assert config.get("EASY") == "written"
+
+            assert config == {"ABC": "defaults", "EASY": "written", "X": 10}
+            assert config.get("X") == 10
+
+    def test_layered_load_resolves_keys_from_highest_precedence_layer(self):
+        config = Config({"abc": "defaults", "easy": "as"}, {"abc": "overrides"}, layered=True)
+        config.register(Env())
+        config.load()
+
+        assert config["ABC"] == "overrides"
+        assert config["EASY"] == "as"
+        assert "DO RE MI" not in config
+        assert dict.__len__(config) == 0
+        assert config == {"ABC": "overrides", "EASY": "as"}
+
+    def test_layered_reload_only_replaces_changed_layers(self):
+        class VersionedAdapter(Adapter):
+            def __init__(self, version, *args, **kwargs):
+                super(VersionedAdapter, self).__init__(*args, **kwargs)
+                self.version = version
+
+            def fingerprint(self):
+                return self.version
+
+            def load(self, formatter=None):
+                self.data = {self.format("abc", formatter): self.version}
+
+        static = VersionedAdapter(1)
+        moving = VersionedAdapter(1)
+        config = Config(layered=True)
+        config.register(static, moving)
+        config.load()
+        static_layer = config._view.maps[-1]
+
+        moving.version = 2
+        config.load()
+
+        assert config["ABC"] == 2
+        assert config._view.maps[-1] is static_layer
+
+    def test_layered_load_reads_values_set_on_the_config(self):
+        config = Config({"abc": "defaults", "easy": "as"}, layered=True)
+        config.load()
+        snapshot = config.snapshot()
+
+        config["ABC"] = "set"
+        config["DO"] = "re"
+
+        assert config["ABC"] == "set"
+        assert config["DO"] == "re"
+        assert config == {"ABC": "set", "EASY": "as", "DO": "re"}
+        assert dict(snapshot) == {"ABC": "defaults", "EASY": "as"}
+
+        # Reloading overrides the values adapters provide, as eager loading does
+        config.load()
+        assert config == {"ABC": "defaults", "EASY": "as", "DO": "re"}
+
+        del config["DO"]
+        assert "DO" not in config
+        with pytest.raises(KeyError):
+            del config["EASY"]
+
+    def test_layered_deep_merge_merges_sections_once_per_load(self):
+        config = Config({"db": {"host": "localhost", "port": 5432}}, {"db": {"port": 5433}},
+                        layered=True, deep_merge=True)
+        config.load()
+
+        assert config["DB"] is config["DB"]
+        config["DB"]["user"] = "root"
+        assert config["DB.user"] == "root"
+
+        config["DB"] = {"host": "remote"}
+        assert config["DB"] == {"host": "remote", "port": 5433}
+
+        config.load()
+        assert config["DB"] == {"host": "localhost", "port": 5433}
+
+    def test_layered_lazy_load_keeps_values_set_while_loading(self):
+        config = Config({"abc": "defaults"}, lazy=True, layered=True)
+        config.load()
+
+        config["DO"] = "re"
+
+        assert config["DO"] == "re"
+        assert config == {"ABC": "defaults", "DO": "re"}
+        assert config["DO"] == "re"
+
+    def test_layered_lazy_load(self):
+        config = Config({"abc": "defaults"}, {"easy": "as"}, lazy=True, layered=True)
+        config.load()
+
+        assert config["EASY"] == "as"
+        assert config["ABC"] == "defaults"
+        assert sorted(config) == ["ABC", "EASY"]
+
+    def test_getitem_with_nested_key_returns_its_value(self):
+        config = Config({"database": {"primary": {"host": "localhost"}}})
+        config.load()
+
+        assert config["DATABASE.primary.host"] == "localhost"
+        assert config["DATABASE.primary"] == {"host": "localhost"}
+        assert "DATABASE.primary.host" in config
+        assert "DATABASE.replica" not in config
+        assert config.get("DATABASE.replica.host", "default") == "default"
+        with pytest.raises(KeyError):
+            config["DATABASE.primary.host.port"]
+
+    def test_getitem_with_nested_key_reflects_config_updates(self):
+        config = Config({"database": {"host": "localhost"}})
+        config.load()
+        assert config["DATABASE.host"] == "localhost"
+
+        config["DATABASE"] = {"host": "remote"}
+        assert config["DATABASE.host"] == "remote"
+
+        del config["DATABASE"]
+        assert "DATABASE.host" not in config
+
+    def test_getitem_with_nested_key_reflects_nested_edits(self):
+        config = Config({"database": {"host": "localhost"}})
+        config.load()
+        assert config.get("DATABASE.host") == "localhost"
+
+        config["DATABASE"]["host"] = "remote"
+        assert config.get("DATABASE.host") == "remote"
+
+    def test_getitem_with_nested_key_indexes_it_until_next_load_or_write(self):
+        defaults = Defaults({"database": {"primary": {"host": "localhost"}}})
+        config = Config(defaults)
+        config.load()
+
+        assert config["DATABASE.primary.host"] == "localhost"
+        assert config._index["DATABASE.primary.host"] == (config["DATABASE"]["primary"], "host")
+
+        config["ABC"] = "123"
+        assert config._index == {}
+        assert config.get("DATABASE.primary.host") == "localhost"
+
+        defaults.data = {"database": {"primary": {"host": "remote"}}}
+        config.load()
+        assert config._index == {}
+        assert config["DATABASE.primary.host"] == "remote"
+
+    def test_layered_getitem_with_nested_key_reflects_reloads(self):
+        defaults = Defaults({"database": {"host": "localhost"}})
+        config = Config(defaults, layered=True)
+        config.load()
+        assert config["DATABASE.host"] == "localhost"
+
+        defaults.data = {"database": {"host": "remote"}}
+        config.load()
+        assert config["DATABASE.host"] == "remote"
+
+        config["DATABASE"] = {"host": "written"}
+        assert config["DATABASE.host"] == "written"
+
+    def test_lazy_getitem_with_nested_key_only_loads_adapters_needed_to_resolve_it(self):
+        class CountingAdapter(Adapter):
+            def __init__(self, data, *args, **kwargs):
+                super(CountingAdapter, self).__init__(*args, **kwargs)
+                self.source = data
+                self.loads = 0
+
+            def load(self, formatter=None):
+                self.loads += 1
+                self.data = dict((self.format(k, formatter), v) for k, v in self.source.items())
+
+        lower = CountingAdapter({"easy": "as"})
+        upper = CountingAdapter({"database": {"host": "localhost"}})
+        config = Config(lazy=True)
+        config.register(lower, upper)
+        config.load()
+
+        assert config["DATABASE.host"] == "localhost"
+        assert lower.loads == 0 and upper.loads == 1
+
+    def test_getitem_with_dotted_top_level_key_returns_its_value(self):
+        config = Config()
+        config["abc.123"] = "easy as"
+
+        assert config["abc.123"] == "easy as"
+
+    def test_getitem_with_nested_key_in_lazy_and_layered_modes(self):
+        for options in ({"lazy": True}, {"layered": True}, {"lazy": True, "layered": True}):
+            config = Config({"database": {"host": "localhost", "port": 5432}},
+                            {"database": {"host": "remote"}}, **options)
+            config.load()
+
+            assert config["DATABASE.host"] == "remote"
+            assert "DATABASE.port" not in config
+
+    def test_deep_merge_load_merges_nested_sections(self):
+        defaults = {"database": {"host": "localhost", "port": 5432}, "cache": {"ttl": 60}}
+        config = Config(defaults, {"database": {"host": "remote"}}, deep_merge=True)
+        config.load()
+
+        assert config["DATABASE"] == {"host": "remote", "port": 5432}
+        assert config["DATABASE.port"] == 5432
+        # Sections a single adapter provides are shared, not copied
+        assert config["CACHE"] is config.defaults.data["CACHE"]
+
+    def test_lazy_deep_merge_reload_drops_keys_removed_from_sources(self):
+        defaults = Defaults({"db": {"old": 1, "host": "h1"}})
+        config = Config(defaults, lazy=True, deep_merge=True)
+        config.load()
+        assert config["DB"] == {"old": 1, "host": "h1"}
+
+        defaults.data = {"db": {"host": "h2"}}
+        config.load()
+
+        assert config["DB"] == {"host": "h2"}
+        assert config == {"DB": {"host": "h2"}}
+
+    def test_deep_merge_load_in_lazy_and_layered_modes(self):
+        for options in ({"lazy": True}, {"layered": True}, {"lazy": True, "layered": True}):
+            config = Config({"database": {"host": "localhost", "port": 5432}},
+                            {"database": {"host": "remote"}}, deep_merge=True, **options)
+            config.load()
+
+            assert config["DATABASE.port"] == 5432
+            assert config["DATABASE"] == {"host": "remote", "port": 5432}
+
+    def test_persistent_snapshots_share_unchanged_entries(self):
+        config = Config({"abc": "123", "easy": {"as": "pie"}}, persistent=True)
+        config.load()
+        first = config.snapshot()
+
+        config.overrides = Overrides({"abc": "456"})
+        config.load()
+        second = config.snapshot()
+
+        assert first["ABC"] == "123"
+        assert second["ABC"] == "456"
+        assert second["EASY"] is first["EASY"]
+        assert not hasattr(second, "__setitem__")
+
+    def test_persistent_snapshot_drops_deleted_keys(self):
+        config = Config({"abc": "123", "easy": "as"}, persistent=True)
+        config.load()
+        first = config.snapshot()
+
+        del config["EASY"]
+        config.defaults = Defaults({"abc": "123"})
+        config.load()
+
+        assert first == {"ABC": "123", "EASY": "as"}
+        assert config.snapshot() == {"ABC": "123"}
+
+    def test_persistent_snapshots_with_layered_load(self):
+        config = Config({"abc": "123", "easy": {"as": "pie"}}, layered=True, persistent=True)
+        config.load()
+        first = config.snapshot()
+
+        config.overrides = Overrides({"abc": "456"})
+        config.load()
+        second = config.snapshot()
+
+        assert isinstance(second, Map)
+        assert first == {"ABC": "123", "EASY": {"as": "pie"}}
+        assert second == {"ABC": "456", "EASY": {"as": "pie"}}
+        assert second["EASY"] is first["EASY"]
+
+    def test_load_with_schema_stores_typed_values(self):
+        config = Config({"port": "8080", "debug": "no"}, schema={
+            "port": Field(int),
+            "debug": Field(bool),
+            "workers": Field(int, default=4),
+        })
+        config.load()
+
+        assert config["PORT"] == 8080
+        assert config["DEBUG"] is False
+        assert config["WORKERS"] == 4
+
+    def test_load_with_invalid_config_raises_and_keeps_previous_values(self):
+        config = Config({"port": "8080"}, schema={"port": Field(int)})
+        config.load()
+
+        config.defaults = Defaults({"port": "http"})
+        with pytest.raises(ValidationError):
+            config.load()
+
+        assert config["PORT"] == 8080
+
+    def test_load_with_schema_in_lazy_and_layered_modes(self):
+        for options in ({"lazy": True}, {"layered": True}):
+            config = Config({"port": "8080"}, schema={"port": Field(int)}, **options)
+            config.load()
+
+            assert config["PORT"] == 8080
+
+    def test_load_with_schema_and_cache_path_hits_cache_after_reloads(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"port": "8080"}))
+        cache_path = str(tmpdir.join('config.cache'))
+
+        config = Config(cache_path=cache_path, schema={"port": Field(int)})
+        config.register(File(str(settings_path)))
+        config.load()
+        config.load()
+
+        cold_config = Config(cache_path=cache_path, schema={"port": Field(int)})
+        cold_config.register(File(str(settings_path)))
+        cold_config.load()
+
+        assert cold_config.load_stats().cached is True
+        assert cold_config["PORT"] == 8080
+
+    def test_freeze_to_object_exposes_values_as_attributes(self):
+        config = Config({"abc": "123", "database": {"host": "localhost"}, "do re": "mi"})
+        config.load()
+
+        frozen = config.freeze_to_object()
+
+        assert frozen.ABC == "123"
+        assert frozen.DATABASE == {"host": "localhost"}
+        assert not hasattr(frozen, "__dict__")
+        with pytest.raises(AttributeError):
+            frozen.ABC = "456"
+
+    def test_freeze_to_object_with_keys_and_attributes(self):
+        config = Config({"database": {"host": "localhost", "port": 5432}})
+        config.load()
+
+        frozen = config.freeze_to_object("DATABASE.host", port="DATABASE.port")
+
+        assert frozen.DATABASE_host == "localhost"
+        assert frozen.port == 5432
+        with pytest.raises(KeyError):
+            config.freeze_to_object("DATABASE.user")
+        with pytest.raises(ValueError):
+            config.freeze_to_object("DO RE")
+
+    def test_freeze_to_object_is_updated_on_reload(self):
+        config = Config({"abc": "123", "easy": "as"}, layered=True)
+        config.load()
+        frozen = config.freeze_to_object()
+
+        config.defaults = Defaults({"abc": "456"})
+        config.load()
+
+        assert frozen.ABC == "456"
+        assert not hasattr(frozen, "EASY")
+
+    def test_freeze_to_object_is_updated_on_lazy_reload(self):
+        config = Config({"port": 1}, lazy=True)
+        config.load()
+        frozen = config.freeze_to_object()
+
+        config.defaults = Defaults({"port": 2})
+        config.load()
+
+        assert frozen.PORT == 2
+
+    def test_freeze_to_object_exposes_subconfigs(self):
+        config = Config({"abc": "123"})
+        config.add_subconfig("database", Config({"host": "localhost"}))
+        config.load()
+
+        frozen = config.freeze_to_object()
+        assert frozen.database.HOST == "localhost"
+
+        config.database.defaults = Defaults({"host": "remote"})
+        config.load()
+        assert frozen.database.HOST == "remote"
+
+    def test_freeze_to_object_with_key_named_as_a_subconfig_raises(self):
+        config = Config({"abc": "123"})
+        config.add_subconfig("ABC", Config({"host": "localhost"}))
+        config.load()
+
+        with pytest.raises(ValueError):
+            config.freeze_to_object()
+
+    def test_load_with_intern_pool_shares_equal_values_across_configs(self):
+        pool = InternPool()
+        configs = [Config({"abc": "".join(["easy ", "as"])}, intern=pool) for _ in range(2)]
+        for config in configs:
+            config.load()
+
+        assert configs[0]["ABC"] is configs[1]["ABC"]
+        assert configs[0].defaults.data["ABC"] is configs[1]["ABC"]
+        assert pool.info().hits == 1
+
+    def test_snapshot_is_read_only(self):
+        config = Config({"abc": "123"})
+        config.load()
+        snapshot = config.snapshot()
+
+        assert snapshot["ABC"] == "123"
+        with pytest.raises(TypeError):
+            snapshot["ABC"] = "456"
+
+    def test_snapshot_is_stable_across_reloads(self):
+        config = Config({"abc": "123"})
+        config.load()
+        snapshot = config.snapshot()
+
+        config.register(Defaults({"abc": "456", "easy": "as"}))
+        config.load()
+
+        assert snapshot == {"ABC": "123"}
+        assert config.snapshot() == {"ABC": "456", "EASY": "as"}
+        assert config.snapshot() is not snapshot
+
+    def test_snapshot_before_load_reflects_config(self):
+        config = Config()
+        config["ABC"] = "123"
+
+        assert config.snapshot() == {"ABC": "123"}
+
+    def test_snapshot_with_layered_and_lazy_load(self):
+        config = Config({"abc": "123"}, {"easy": "as"}, lazy=True, layered=True)
+        config.load()
+
+        assert config.snapshot() == {"ABC": "123", "EASY": "as"}
+
+    def test_deepcopy_copies_loaded_data(self):
+        config = Config({"abc": "123"})
+        config.load()
+
+        copied = copy.deepcopy(config)
+        copied["EASY"] = "as"
+        copied.load()
+
+        assert config == {"ABC": "123"}
+        assert copied == {"ABC": "123", "EASY": "as"}
+
+    def test_pickle_round_trip_after_load(self):
+        config = Config({"abc": "123"})
+        config.load()
+        config.freeze_to_object()
+
+        unpickled = pickle.loads(pickle.dumps(config))
+        unpickled.load()
+
+        assert unpickled == {"ABC": "123"}
+        assert unpickled.load_stats().adapters[0].cached is False
+
+    def test_deepcopy_with_lazy_and_layered_load(self):
+        for options in ({"lazy": True}, {"layered": True}):
+            config = Config({"abc": "123"}, {"easy": "as"}, **options)
+            config.load()
+            config["DO"] = "re mi"
+
+            copied = copy.deepcopy(config)
+
+            assert copied == config
+            assert copied.snapshot() == {"ABC": "123", "EASY": "as", "DO": "re mi"}
+
+    def test_load_with_cache_path_skips_adapters_loading_on_hit(self, tmpdir):
+        class CountingAdapter(Adapter):
+            loads = 0
+
+            def persistent_fingerprint(self):
+                return "abc"
+
+            def load(self, formatter=None):
+                CountingAdapter.loads += 1
+                self.data = {self.format("abc", formatter): "123"}
+
+        cache_path = str(tmpdir.join('config.cache'))
+
+        config = Config(cache_path=cache_path)
+        config.register(CountingAdapter())
+        config.load()
+
+        cold_config = Config(cache_path=cache_path)
+        cold_config.register(CountingAdapter())
+        cold_config.load()
+
+        assert CountingAdapter.loads == 1
+        assert cold_config["ABC"] == "123"
+
+    def test_load_with_cache_path_reloads_modified_file(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"abc": "123"}))
+        cache_path = str(tmpdir.join('config.cache'))
+
+        config = Config(cache_path=cache_path)
+        config.register(File(str(settings_path)))
+        config.load()
+
+        settings_path.write(json.dumps({"abc": "456 789"}))
+        cold_config = Config(cache_path=cache_path)
+        cold_config.register(File(str(settings_path)))
+        cold_config.load()
+
+        assert cold_config["ABC"] == "456 789"
+
+    def test_load_with_cache_path_caches_adapters_data_only(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"a": 1, "old": 1}))
+        cache_path = str(tmpdir.join('config.cache'))
+
+        config = Config(cache_path=cache_path)
+        config.register(File(str(settings_path)))
+        config.load()
+        config["RUNTIME_ONLY"] = "easy as"
+        settings_path.write(json.dumps({"a": 2}))
+        config.load()
+
+        cold_config = Config(cache_path=cache_path)
+        cold_config.register(File(str(settings_path)))
+        cold_config.load()
+
+        assert cold_config.load_stats().cached is True
+        assert cold_config == {"A": 2}
+
+    def test_load_with_projection_keeps_selected_keys_only(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"abc": {"123": "do", "456": "re"}, "mi": "fa"}))
+
+        config = Config({"easy": "as", "sol": "la"}, projection=["abc.123", "easy"])
+        file_adapter = File(str(settings_path))
+        config.register(file_adapter)
+        config.load()
+
+        assert file_adapter.projection is None
+        assert config == {"ABC": {"123": "do"}, "EASY": "as"}
+
+    def test_load_after_projection_change_loads_adapters_again(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"abc": "123", "easy": "as"}))
+
+        config = Config(projection=["abc"])
+        config.register(File(str(settings_path)))
+        config.load()
+        assert config == {"ABC": "123"}
+
+        config.projection = None
+        config.load()
+
+        assert config == {"ABC": "123", "EASY": "as"}
+
+    def test_load_with_projection_of_a_file_shared_by_configs(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"abc": "123", "easy": "as"}))
+        file_adapter = File(str(settings_path))
+
+        first = Config(projection=["abc"])
+        first.register(file_adapter)
+        first.load()
+        second = Config(projection=["easy"])
+        second.register(file_adapter)
+        second.load()
+
+        assert first == {"ABC": "123"}
+        assert second == {"EASY": "as"}
+
+    def test_load_stats_measure_each_adapter(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"abc": "123", "easy": "as"}))
+
+        config = Config({"do": "re"})
+        file_adapter = File(str(settings_path))
+        config.register(file_adapter)
+        config.load()
+
+        stats = config.load_stats()
+        assert stats.wall_time > 0
+        assert stats.cached is False
+        assert [adapter_stats.adapter for adapter_stats in stats.adapters] == list(config.adapters)
+
+        defaults_stats, file_stats = stats.adapters
+        assert defaults_stats.keys == 1
+        assert defaults_stats.io_time is None
+        assert defaults_stats.bytes_read is None
+        assert file_stats.keys == 2
+        assert file_stats.bytes_read == settings_path.size()
+        assert file_stats.wall_time >= file_stats.io_time + file_stats.parse_time
+        assert file_stats.cached is False
+
+    def test_load_stats_mark_unchanged_adapters_as_cached(self, tmpdir):
+        settings_path = tmpdir.join('settings.json')
+        settings_path.write(json.dumps({"abc": "123"}))
+
+        config = Config()
+        config.register(File(str(settings_path)))
+        config.load()
+        config.load()
+
+        file_stats = config.load_stats().adapters[0]
+        assert file_stats.cached is True
+        assert file_stats.bytes_read == 0
+        assert file_stats.parse_time == 0.0
+
+    def test_load_stats_include_subconfigs(self):
+        config = Config({"abc": "123"})
+        config.add_subconfig("sub", Config({"easy": "as", "do": "re"}))
+        config.load()
+
+        subconfig_stats = config.load_stats().subconfigs["sub"]
+        assert subconfig_stats.adapters[0].keys == 2
+        assert subconfig_stats.subconfigs == {}
+
+    def test_load_hooks_are_called_around_each_adapter_load(self):
+        calls = []
+        config = Config({"abc": "123"}, None, None, Env(), workers=2)
+        config.add_subconfig("sub", Config({"easy": "as"}))
+        config.add_load_hook(before=lambda config, adapter: calls.append(('before', adapter)),
+                             after=lambda config, adapter, stats, error: calls.append(('after', stats.adapter)))
+        config.load()
+
+        adapters = list(config.adapters) + list(config.sub.adapters)
+        assert sorted(calls, key=repr) == sorted([(when, adapter) for adapter in adapters
+                                                  for when in ('before', 'after')], key=repr)
+
+    def test_load_hooks_are_given_adapter_errors(self):
+        class FailingAdapter(Adapter):
+            def load(self, formatter=None):
+                raise RuntimeError("abc")
+
+        errors = []
+        config = Config()
+        config.register(FailingAdapter())
+        config.add_load_hook(after=lambda config, adapter, stats, error: errors.append((stats, error)))
+
+        with pytest.raises(RuntimeError):
+            config.load()
+
+        assert len(errors) == 1
+        assert errors[0][0] is None
+        assert isinstance(errors[0][1], RuntimeError)
@@ -3,7 +3,12 @@ import pytest
 from etcaetera.formatters import (
     uppercased,
     lowercased,
-    environ
+    environ,
+    FormatCache,
+    cached_format,
+    format_cache,
+    format_cache_info,
+    format_cache_clear,
 )
 
 
@@ -25,3 +30,45 @@ def test_lowercased_with_lowercased_str():
 
 def test_environ():
     assert environ("aBc 123") == "ABC_123"
+
+
+def test_cached_format_returns_formatter_result():
+    assert cached_format(environ, "aBc 123") == "ABC_123"
+    assert cached_format(lowercased, "aBc 123") == "abc 123"
+
+
+def test_cached_format_interns_formatted_keys():
+    first = cached_format(uppercased, "".join(["easy ", "as"]))
+    second = cached_format(lowercased, "EASY AS").upper()
+
+    assert first == second
+    assert cached_format(uppercased, second) is first
+
+
+def test_format_cache_returns_formatted_keys_by_key():
+    cache = format_cache(uppercased)
+
+    assert cache["do re mi"] == "DO RE MI"
+    assert format_cache(uppercased) is cache
+    assert cache.get("do re mi") == "DO RE MI"
+
+
+def test_format_cache_info_counts_misses():
+    format_cache_clear()
+
+    cached_format(uppercased, "do re mi")
+    format_cache(uppercased)["do re mi"]
+    info = format_cache_info()
+
+    assert info.formatters == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_format_cache_drops_its_keys_once_full():
+    cache = FormatCache(uppercased, maxsize=2)
+
+    cache["abc"], cache["easy"], cache["123"]
+
+    assert dict(cache) == {"123": "123"}
+    assert cache.misses == 3
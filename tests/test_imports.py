@@ -0,0 +1,62 @@
+import sys
+import subprocess
+
+import pytest
+
+
+def imported_modules(statement):
+    """Returns the modules a fresh interpreter imported to run statement"""
+    script = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "{0}\n"
+        "print('\\n'.join(sorted(set(sys.modules) - before)))\n"
+    ).format(statement)
+    output = subprocess.check_output([sys.executable, '-c', script])
+    return set(output.decode('utf-8').split())
+
+
+class TestImports:
+    @pytest.mark.parametrize('module', [
+        'asyncio',
+        'concurrent.futures',
+        'json',
+        'yaml',
+        'mmap',
+        'pickle',
+        'hashlib',
+        'etcaetera.parsers',
+        'etcaetera.adapter.file',
+        'etcaetera.watcher',
+    ])
+    def test_import_config_does_not_import_heavy_modules(self, module):
+        assert module not in imported_modules("import etcaetera.config")
+
+    def test_load_config_without_file_adapters_does_not_import_them(self):
+        modules = imported_modules(
+            "from etcaetera.config import Config\n"
+            "Config({'abc': '123'}, {'easy': 'as'}).load()"
+        )
+
+        assert 'etcaetera.adapter.file' not in modules
+        assert 'etcaetera.parsers' not in modules
+
+    def test_import_adapter_only_imports_accessed_adapters(self):
+        modules = imported_modules("from etcaetera.adapter import Env")
+
+        assert 'etcaetera.adapter.env' in modules
+        assert 'etcaetera.adapter.file' not in modules
+        assert 'etcaetera.adapter.module' not in modules
+
+    def test_star_import_adapter_exposes_every_adapter(self):
+        namespace = {}
+        exec("from etcaetera.adapter import *", namespace)
+
+        for name in ('Adapter', 'AdapterSet', 'Defaults', 'Env', 'File', 'Module', 'Overrides'):
+            assert name in namespace
+
+    def test_access_unknown_adapter_raises_attribute_error(self):
+        import etcaetera.adapter
+
+        with pytest.raises(AttributeError):
+            etcaetera.adapter.Unknown
@@ -0,0 +1,50 @@
+from etcaetera.interning import InternPool
+
+
+def distinct(value):
+    """Returns a new instance of a str or bytes value"""
+    return value[:1] + value[1:]
+
+
+class TestInternPool:
+    def test_intern_returns_canonical_instance(self):
+        pool = InternPool()
+        first, second = distinct("easy as 123"), distinct("easy as 123")
+        assert first is not second
+
+        assert pool.intern(first) is first
+        assert pool.intern(second) is first
+        assert pool.info().hits == 1
+        assert pool.info().saved_bytes > 0
+
+    def test_intern_distinguishes_equal_values_of_different_types(self):
+        pool = InternPool()
+        pool.intern(1)
+
+        assert pool.intern(1.0).__class__ is float
+        assert pool.intern(True) is True
+
+    def test_intern_skips_signed_zeros_and_nans(self):
+        pool = InternPool()
+        pool.intern(0.0)
+
+        assert str(pool.intern(-0.0)) == "-0.0"
+        assert len(pool) == 0
+
+    def test_intern_stops_taking_values_once_full(self):
+        pool = InternPool(maxsize=1)
+        pool.intern("abc")
+        pool.intern("easy")
+
+        assert len(pool) == 1
+
+    def test_intern_data_replaces_nested_values_in_place(self):
+        pool = InternPool()
+        canonical = pool.intern(distinct("localhost"))
+        nested = {"host": distinct("localhost"), "hosts": [distinct("localhost")]}
+        data = {"database": nested}
+
+        assert pool.intern_data(data) is data
+        assert data["database"] is nested
+        assert nested["host"] is canonical
+        assert nested["hosts"][0] is canonical
@@ -0,0 +1,163 @@
+import sys
+import json
+import yaml
+import pytest
+import importlib.machinery
+
+from etcaetera import parsers
+from etcaetera.parsers import (
+    json_stream_load,
+    yaml_projected_load,
+    python_settings_load,
+)
+
+
+@pytest.fixture
+def json_path(tmpdir):
+    def write(content):
+        path = tmpdir.join('settings.json')
+        path.write_text(content, encoding='utf-8')
+        return str(path)
+    return write
+
+
+SAMPLE = {
+    "abc": "123",
+    " easy as ": [1, 2, {"do re mi": "}\"{"}],
+    "number": -1.5e10,
+    "flags": [True, False, None],
+    "unicode": u"é☃",
+}
+
+
+class TestJsonStreamLoad:
+    @pytest.mark.parametrize('chunk_size', [1, 2, 7, 4096])
+    def test_parses_like_json_load(self, json_path, monkeypatch, chunk_size):
+        monkeypatch.setattr('etcaetera.parsers._MappedText.__init__.__defaults__', (chunk_size,))
+        path = json_path(json.dumps(SAMPLE, ensure_ascii=False, indent=2))
+
+        with open(path) as fd:
+            assert json_stream_load(fd) == SAMPLE
+
+    def test_parses_non_object_document_as_a_whole(self, json_path):
+        path = json_path(json.dumps([1, 2, 3]))
+
+        with open(path) as fd:
+            assert json_stream_load(fd) == [1, 2, 3]
+
+    def test_parses_empty_object(self, json_path):
+        path = json_path(u' { } ')
+
+        with open(path) as fd:
+            assert json_stream_load(fd) == {}
+
+    @pytest.mark.parametrize('content', [u'', u'{', u'{"abc": 1', u'{"abc": 1,}',
+                                         u'{"abc" 1}', u'{"abc": 1} 2', u'{"abc": 1.}'])
+    def test_malformed_document_raises(self, json_path, content):
+        path = json_path(content)
+
+        with open(path) as fd:
+            with pytest.raises(ValueError):
+                json_stream_load(fd)
+
+    def test_skips_members_rejected_by_keep(self, json_path):
+        path = json_path(json.dumps(SAMPLE))
+
+        with open(path) as fd:
+            document = json_stream_load(fd, keep=lambda key: key in ("abc", "flags"))
+
+        assert document == {"abc": "123", "flags": [True, False, None]}
+
+    @pytest.mark.parametrize('chunk_size', [1, 3, 4096])
+    def test_skips_members_spanning_chunks(self, json_path, monkeypatch, chunk_size):
+        monkeypatch.setattr('etcaetera.parsers._MappedText.__init__.__defaults__', (chunk_size,))
+        path = json_path(json.dumps(SAMPLE, ensure_ascii=False, indent=2))
+
+        with open(path) as fd:
+            document = json_stream_load(fd, keep=lambda key: key == "unicode")
+
+        assert document == {"unicode": u"é☃"}
+
+
+class TestYamlProjectedLoad:
+    def test_constructs_members_selected_by_keep_only(self, tmpdir):
+        path = tmpdir.join('settings.yaml')
+        path.write(u"base: &base\n  abc: 123\nderived:\n  <<: *base\n  easy: as\nskipped: [1, 2]\n")
+
+        with open(str(path)) as fd:
+            document = yaml_projected_load(fd, yaml.SafeLoader, lambda key: key != "skipped")
+
+        assert document == {"base": {"abc": 123}, "derived": {"abc": 123, "easy": "as"}}
+
+
+class TestJsonBackends:
+    def test_detect_json_backend_falls_back_to_json(self, monkeypatch):
+        def missing():
+            raise ImportError
+        monkeypatch.setattr('etcaetera.parsers._detected_json_backend', None)
+        for name in ('orjson', 'ujson', 'simdjson'):
+            monkeypatch.setitem(parsers._json_backends_loaders, name, missing)
+
+        assert parsers.detect_json_backend() == 'json'
+
+    def test_set_json_backend_with_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            parsers.set_json_backend('abc 123')
+
+    @pytest.mark.parametrize('name', ['orjson', 'ujson', 'simdjson', 'json'])
+    def test_backends_results_are_identical(self, json_path, name):
+        pytest.importorskip(name)
+        document = dict(SAMPLE, big=2 ** 70, infinity=float('inf'))
+        path = json_path(json.dumps(document, ensure_ascii=False))
+
+        with open(path, 'rb') as fd:
+            assert parsers.json_backend_parse(fd.read(), name) == document
+
+
+class TestPythonSettingsLoad:
+    def test_returns_file_globals(self, tmpdir):
+        path = tmpdir.join('settings.py')
+        path.write(u"ABC = 123\neasy = 'as'\n")
+
+        namespace = python_settings_load(str(path))
+
+        assert namespace['ABC'] == 123
+        assert namespace['easy'] == 'as'
+        assert namespace['__file__'] == str(path)
+
+    def test_does_not_touch_sys_modules(self, tmpdir):
+        path = tmpdir.join('mod.py')
+        path.write(u"ABC = 123\n")
+        modules = dict(sys.modules)
+
+        python_settings_load(str(path))
+
+        assert sys.modules == modules
+
+    def test_reuses_compiled_code_while_file_is_unchanged(self, tmpdir, monkeypatch):
+        path = tmpdir.join('settings.py')
+        path.write(u"ABC = 123\n")
+        compilations = []
+        source_to_code = importlib.machinery.SourceFileLoader.source_to_code
+
+        def counting_source_to_code(self, *args, **kwargs):
+            compilations.append(args)
+            return source_to_code(self, *args, **kwargs)
+        monkeypatch.setattr(importlib.machinery.SourceFileLoader, 'source_to_code',
+                            counting_source_to_code)
+
+        python_settings_load(str(path))
+        assert python_settings_load(str(path))['ABC'] == 123
+        assert len(compilations) == 1
+
+        path.write(u"ABC = 456\n")
+        assert python_settings_load(str(path))['ABC'] == 456
+        assert len(compilations) == 2
+
+    def test_executes_in_fresh_namespace(self, tmpdir):
+        path = tmpdir.join('settings.py')
+        path.write(u"try:\n    ABC += 1\nexcept NameError:\n    ABC = 1\n")
+
+        python_settings_load(str(path))
+
+        assert python_settings_load(str(path))['ABC'] == 1
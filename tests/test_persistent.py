@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from etcaetera.persistent import PersistentMap, Map, _ImmutablesMap
+
+
+class CollidingKey(object):
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 3
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.value == self.value
+
+
+def nodes(persistent_map):
+    """Returns the ids of a map trie nodes"""
+    found, pending = set(), [persistent_map._root]
+    while pending:
+        node = pending.pop()
+        found.add(id(node))
+        pending.extend(entry for entry in node.entries if type(entry) is not tuple)
+    return found
+
+
+class TestPersistentMap:
+    def test_init_with_mapping_and_keywords(self):
+        persistent_map = PersistentMap({"abc": "123"}, easy="as")
+
+        assert len(persistent_map) == 2
+        assert persistent_map["abc"] == "123"
+        assert persistent_map == {"abc": "123", "easy": "as"}
+
+    def test_getitem_with_missing_key_raises(self):
+        persistent_map = PersistentMap({"abc": "123"})
+
+        with pytest.raises(KeyError):
+            persistent_map["easy"]
+        assert persistent_map.get("easy", "default") == "default"
+        assert "easy" not in persistent_map
+
+    def test_set_returns_new_map_and_leaves_original_untouched(self):
+        persistent_map = PersistentMap({"abc": "123"})
+        updated = persistent_map.set("abc", "456").set("easy", "as")
+
+        assert persistent_map == {"abc": "123"}
+        assert updated == {"abc": "456", "easy": "as"}
+
+    def test_set_same_value_returns_same_map(self):
+        value = object()
+        persistent_map = PersistentMap({"abc": value})
+
+        assert persistent_map.set("abc", value) is persistent_map
+
+    def test_delete_returns_new_map_without_key(self):
+        persistent_map = PersistentMap({"abc": "123", "easy": "as"})
+        deleted = persistent_map.delete("abc")
+
+        assert deleted == {"easy": "as"}
+        assert persistent_map == {"abc": "123", "easy": "as"}
+        with pytest.raises(KeyError):
+            deleted.delete("abc")
+
+    def test_colliding_keys(self):
+        keys = [CollidingKey(value) for value in range(12)]
+        persistent_map = PersistentMap((key, key.value) for key in keys)
+
+        assert all(persistent_map[key] == key.value for key in keys)
+        for key in keys[:11]:
+            persistent_map = persistent_map.delete(key)
+        assert list(persistent_map.items()) == [(keys[11], 11)]
+
+    def test_random_operations_match_dict(self):
+        rand = random.Random(42)
+        keys = [CollidingKey(value) for value in range(20)] + list(range(-100, 100))
+        persistent_map, reference = PersistentMap(), {}
+
+        for _ in range(5000):
+            key = rand.choice(keys)
+            if rand.random() < 0.6:
+                value = rand.random()
+                persistent_map, reference[key] = persistent_map.set(key, value), value
+            elif key in reference:
+                persistent_map = persistent_map.delete(key)
+                del reference[key]
+
+            assert len(persistent_map) == len(reference)
+
+        assert dict(persistent_map.items()) == reference
+
+    def test_set_shares_nodes_with_previous_version(self):
+        # Integers hash to themselves, keeping the trie depth deterministic
+        persistent_map = PersistentMap((i, i) for i in range(10000))
+        updated = persistent_map.set(42, "changed")
+
+        previous_nodes, updated_nodes = nodes(persistent_map), nodes(updated)
+        # Only the nodes on the path to the key are copied
+        assert len(updated_nodes - previous_nodes) <= 4
+
+
+class TestMap:
+    def test_compares_equal_to_mappings_with_same_items(self):
+        persistent_map = Map({"abc": "123"}).update({"easy": "as"})
+
+        assert persistent_map == {"abc": "123", "easy": "as"}
+        assert persistent_map.delete("easy") == {"abc": "123"}
+        assert persistent_map.set("abc", "456") != {"abc": "123", "easy": "as"}
+
+    def test_immutables_map_compares_equal_to_mappings_with_same_items(self):
+        pytest.importorskip("immutables")
+        immutables_map = _ImmutablesMap({"abc": "123"})
+
+        assert immutables_map == {"abc": "123"}
+        assert immutables_map.set("easy", "as") == {"abc": "123", "easy": "as"}
+        assert immutables_map.get("easy") is None
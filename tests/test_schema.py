@@ -0,0 +1,118 @@
+import pytest
+
+from etcaetera.exceptions import ValidationError
+from etcaetera.formatters import uppercased
+from etcaetera.schema import Schema, Field, to_bool, to_list
+
+
+def test_to_bool():
+    assert to_bool("Yes") is True
+    assert to_bool("off") is False
+    assert to_bool(1) is True
+    with pytest.raises(ValueError):
+        to_bool("maybe")
+
+
+def test_to_list():
+    assert to_list("abc, 123") == ["abc", "123"]
+    assert to_list("") == []
+    assert to_list(("abc",)) == ["abc"]
+
+
+class TestSchema:
+    def test_validate_coerces_values_to_their_field_type(self):
+        schema = Schema({
+            "port": Field(int),
+            "ratio": Field(float),
+            "debug": Field(bool),
+            "hosts": Field(list),
+        })
+        data = {"port": "8080", "ratio": "0.5", "debug": "true", "hosts": "abc,easy"}
+
+        assert schema.validate(data) == {
+            "port": 8080,
+            "ratio": 0.5,
+            "debug": True,
+            "hosts": ["abc", "easy"],
+        }
+
+    def test_validate_keeps_values_already_typed(self):
+        hosts = ["abc"]
+        schema = Schema({"hosts": Field(list)})
+
+        assert schema.validate({"hosts": hosts})["hosts"] is hosts
+
+    def test_validate_with_missing_key_returns_default(self):
+        schema = Schema({"port": Field(int, default=8080)})
+
+        assert schema.validate({}) == {"port": 8080}
+
+    def test_validate_with_missing_required_key_raises(self):
+        schema = Schema({"port": Field(int)})
+
+        with pytest.raises(ValidationError):
+            schema.validate({})
+
+    def test_validate_with_invalid_value_raises(self):
+        schema = Schema({"port": Field(int)})
+
+        with pytest.raises(ValidationError):
+            schema.validate({"port": "abc"})
+
+    def test_validate_only_coerces_strings_and_ints_to_floats(self):
+        schema = Schema({"port": Field(int), "ratio": Field(float), "name": Field()})
+
+        assert schema.validate({"port": 80, "ratio": 1, "name": "abc"}) == {
+            "port": 80,
+            "ratio": 1.0,
+            "name": "abc",
+        }
+        for data in ({"port": 3.9}, {"port": True}, {"ratio": True}, {"name": {"abc": "123"}}):
+            with pytest.raises(ValidationError):
+                schema.validate(dict({"port": 80, "ratio": 1.0, "name": "abc"}, **data))
+
+    def test_validate_gives_any_value_to_custom_coerce_functions(self):
+        schema = Schema({"port": Field(int, coerce=round)})
+
+        assert schema.validate({"port": 3.9}) == {"port": 4}
+
+    def test_validate_checks_constraints(self):
+        schema = Schema({
+            "port": Field(int, minimum=1, maximum=65535),
+            "mode": Field(choices=["fast", "safe"], default="safe"),
+        })
+
+        assert schema.validate({"port": "80"}) == {"port": 80, "mode": "safe"}
+        with pytest.raises(ValidationError):
+            schema.validate({"port": "0"})
+        with pytest.raises(ValidationError):
+            schema.validate({"port": "65536"})
+        with pytest.raises(ValidationError):
+            schema.validate({"port": "80", "mode": "slow"})
+
+    def test_validate_nested_keys_copies_sections_only_along_their_path(self):
+        schema = Schema({"database.port": Field(int), "database.user": Field(default="root")})
+        replica = {"host": "remote"}
+        data = {"DATABASE": {"port": "5432", "replica": replica}}
+
+        validated = schema.validate(data, uppercased)
+
+        assert validated == {"DATABASE": {"port": 5432, "user": "root", "replica": replica}}
+        assert validated["DATABASE"]["replica"] is replica
+        assert data == {"DATABASE": {"port": "5432", "replica": replica}}
+
+    def test_validate_nested_keys_with_value_in_place_of_section_raises(self):
+        schema = Schema({"database.port": Field(int, default=5432)})
+
+        with pytest.raises(ValidationError):
+            schema.validate({"database": "not a mapping"})
+
+    def test_compile_generates_validation_function_once_per_formatter(self):
+        schema = Schema({"port": Field(int)})
+
+        schema.validate({"PORT": "80"}, uppercased)
+        validator = schema._compiled[uppercased]
+        schema.validate({"PORT": "81"}, uppercased)
+
+        assert schema._compiled[uppercased] is validator
+        assert validator.source.startswith("def validate(data):")
@@ -1,9 +1,15 @@
 import pytest
 
 from etcaetera.exceptions import MalformationError
+from etcaetera.formatters import uppercased
 from etcaetera.utils import (
    format_key,
    is_nested_key,
+   split_key,
+   copy_nested,
+   deep_merge,
+   compile_projection,
+   project,
 )
 
 
@@ -40,3 +46,78 @@ def test_is_nested_with_invalid_key_nesting_raises():
 
     with pytest.raises(MalformationError):
         is_nested_key('abc..123')
+
+
+def test_compile_projection_with_flat_keys():
+    assert compile_projection(['abc', 'easy']) == {'abc': None, 'easy': None}
+
+
+def test_compile_projection_with_nested_keys():
+    assert compile_projection(['abc.123', 'abc.456', 'easy']) == {
+        'abc': {'123': None, '456': None},
+        'easy': None
+    }
+
+
+def test_compile_projection_keeps_whole_value_over_nested_keys():
+    assert compile_projection(['abc', 'abc.123']) == {'abc': None}
+    assert compile_projection(['abc.123', 'abc']) == {'abc': None}
+
+
+def test_compile_projection_formats_top_level_keys():
+    assert compile_projection(['abc.def'], uppercased) == {'ABC': {'def': None}}
+
+
+def test_compile_projection_with_invalid_key_nesting_raises():
+    with pytest.raises(MalformationError):
+        compile_projection(['abc..123'])
+
+
+def test_project():
+    data = {'abc': {'123': 'do', '456': 're'}, 'easy': 'as', 'mi': {'fa': 'sol'}}
+    tree = compile_projection(['abc.123', 'easy', 'mi.la', 'si'])
+
+    assert project(data, tree) == {'abc': {'123': 'do'}, 'easy': 'as', 'mi': {}}
+
+
+def test_split_key_returns_dotted_key_path():
+    assert split_key('abc.123.do') == ('abc', '123', 'do')
+    assert split_key('abc') == ('abc',)
+
+
+def test_split_key_with_invalid_nested_key_raises():
+    with pytest.raises(MalformationError):
+        split_key('abc..123')
+
+
+def test_deep_merge_merges_nested_mappings():
+    base = {'abc': {'123': 'do', '456': 're'}, 'easy': 'as'}
+    other = {'abc': {'456': 'mi'}, 'easy': {'as': 'pie'}}
+
+    assert deep_merge(base, other) == {'abc': {'123': 'do', '456': 'mi'}, 'easy': {'as': 'pie'}}
+    assert base == {'abc': {'123': 'do', '456': 're'}, 'easy': 'as'}
+    assert other == {'abc': {'456': 'mi'}, 'easy': {'as': 'pie'}}
+
+
+def test_deep_merge_shares_subtrees_not_overlapping():
+    base = {'abc': {'123': {'do': 're'}, '456': {'mi': 'fa'}}, 'easy': {'as': 'pie'}}
+    other = {'abc': {'456': {'sol': 'la'}}}
+
+    merged = deep_merge(base, other)
+
+    assert merged['easy'] is base['easy']
+    assert merged['abc']['123'] is base['abc']['123']
+    assert merged['abc'] is not base['abc']
+
+
+def test_copy_nested_copies_containers_only():
+    leaf = object()
+    data = {'abc': {'123': [leaf, {'do': 're'}]}}
+
+    copied = copy_nested(data)
+
+    assert copied == data
+    assert copied['abc'] is not data['abc']
+    assert copied['abc']['123'] is not data['abc']['123']
+    assert copied['abc']['123'][1] is not data['abc']['123'][1]
+    assert copied['abc']['123'][0] is leaf
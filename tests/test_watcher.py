@@ -0,0 +1,173 @@
+import os
+import sys
+import json
+import time
+import shutil
+import pytest
+import tempfile
+
+from etcaetera.config import Config
+from etcaetera.adapter import File
+from etcaetera.watcher import (
+    Watcher,
+    PollingBackend,
+)
+
+
+BACKENDS = ['polling']
+if sys.platform.startswith('linux'):
+    BACKENDS.append('inotify')
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def write_json(path, data):
+    with open(path, 'w') as f:
+        f.write(json.dumps(data))
+
+
+@pytest.fixture
+def config_dir(request):
+    directory = tempfile.mkdtemp()
+
+    def fin():
+        shutil.rmtree(directory)
+    request.addfinalizer(fin)
+
+    return directory
+
+
+class TestPollingBackend:
+    def test_wait_returns_false_without_changes(self, config_dir):
+        path = os.path.join(config_dir, 'settings.json')
+        write_json(path, {'abc': '123'})
+        backend = PollingBackend([path], interval=0.01)
+
+        assert backend.wait(timeout=0.05) is False
+
+    def test_wait_returns_true_on_change(self, config_dir):
+        path = os.path.join(config_dir, 'settings.json')
+        write_json(path, {'abc': '123'})
+        backend = PollingBackend([path], interval=0.01)
+
+        write_json(path, {'abc': '456 789'})
+
+        assert backend.wait(timeout=1) is True
+
+
+class TestWatcher:
+    def test_init_with_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            Watcher(Config(), backend='abc 123')
+
+    def test_check_without_changes_does_not_reload(self, config_dir):
+        path = os.path.join(config_dir, 'settings.json')
+        write_json(path, {'abc': '123'})
+        config = Config()
+        config.register(File(path))
+
+        watcher = Watcher(config, backend='polling')
+
+        assert watcher.check() is False
+
+    @pytest.mark.parametrize('backend', BACKENDS)
+    def test_reloads_config_on_file_write(self, config_dir, backend):
+        path = os.path.join(config_dir, 'settings.json')
+        write_json(path, {'abc': '123'})
+        config = Config()
+        config.register(File(path))
+        config.load()
+
+        watcher = config.watch(backend=backend, interval=0.01, debounce=0.02)
+        try:
+            write_json(path, {'abc': '456 789'})
+            assert wait_for(lambda: config['ABC'] == '456 789')
+        finally:
+            watcher.stop()
+
+    @pytest.mark.parametrize('backend', BACKENDS)
+    def test_keeps_reloading_after_callback_raised(self, config_dir, backend):
+        path = os.path.join(config_dir, 'settings.json')
+        write_json(path, {'abc': '123'})
+        config = Config()
+        config.register(File(path))
+        config.load()
+
+        def callback(config):
+            raise RuntimeError("easy as do re mi")
+
+        watcher = config.watch(backend=backend, interval=0.01, debounce=0.02, callback=callback)
+        try:
+            write_json(path, {'abc': '456'})
+            assert wait_for(lambda: config['ABC'] == '456')
+            write_json(path, {'abc': '789 10'})
+            assert wait_for(lambda: config['ABC'] == '789 10')
+        finally:
+            watcher.stop()
+
+    @pytest.mark.parametrize('backend', BACKENDS)
+    def test_reloads_config_on_atomic_rename(self, config_dir, backend):
+        path = os.path.join(config_dir, 'settings.json')
+        write_json(path, {'abc': '123'})
+        config = Config()
+        config.register(File(path))
+        config.load()
+
+        watcher = config.watch(backend=backend, interval=0.01, debounce=0.02)
+        try:
+            write_json(path + '.tmp', {'abc': '456 789'})
+            os.rename(path + '.tmp', path)
+            assert wait_for(lambda: config['ABC'] == '456 789')
+        finally:
+            watcher.stop()
+
+    @pytest.mark.parametrize('backend', BACKENDS)
+    def test_reloads_config_on_configmap_symlink_swap(self, config_dir, backend):
+        # Mimics the way Kubernetes updates ConfigMaps volumes
+        os.mkdir(os.path.join(config_dir, '..v1'))
+        write_json(os.path.join(config_dir, '..v1', 'settings.json'), {'abc': '123'})
+        os.symlink('..v1', os.path.join(config_dir, '..data'))
+        path = os.path.join(config_dir, 'settings.json')
+        os.symlink(os.path.join('..data', 'settings.json'), path)
+
+        config = Config()
+        config.register(File(path))
+        config.load()
+
+        reloaded = []
+        watcher = config.watch(backend=backend, interval=0.01, debounce=0.02,
+                               callback=reloaded.append)
+        try:
+            os.mkdir(os.path.join(config_dir, '..v2'))
+            write_json(os.path.join(config_dir, '..v2', 'settings.json'), {'abc': '456 789'})
+            os.symlink('..v2', os.path.join(config_dir, '..data_tmp'))
+            os.rename(os.path.join(config_dir, '..data_tmp'), os.path.join(config_dir, '..data'))
+            shutil.rmtree(os.path.join(config_dir, '..v1'))
+
+            assert wait_for(lambda: config['ABC'] == '456 789')
+            assert reloaded[0] is config
+        finally:
+            watcher.stop()
+
+    def test_watches_subconfigs_files(self, config_dir):
+        path = os.path.join(config_dir, 'settings.json')
+        write_json(path, {'abc': '123'})
+        config = Config()
+        subconfig = Config()
+        subconfig.register(File(path))
+        config.add_subconfig('sub', subconfig)
+        config.load()
+
+        watcher = config.watch(backend='polling', interval=0.01, debounce=0.02)
+        try:
+            write_json(path, {'abc': '456 789'})
+            assert wait_for(lambda: subconfig['ABC'] == '456 789')
+        finally:
+            watcher.stop()